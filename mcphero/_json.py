@@ -0,0 +1,31 @@
+"""
+JSON helpers used on the request/response hot path.
+
+Uses `orjson` when it is installed and falls back to the standard library:
+    pip install mcphero[orjson]
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    loads = json.loads
+    dumps = json.dumps
+
+    def dumps_bytes(obj: Any, /) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+else:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # keep catching the stdlib exception.
+    loads = orjson.loads
+    dumps_bytes = orjson.dumps
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
@@ -1,15 +1,59 @@
 from __future__ import annotations
 
-import json
-import uuid
+import asyncio
+import functools
+import itertools
+import time
+from collections.abc import AsyncIterator
 from enum import Enum
+from typing import Any, TypeVar
 
 import httpx
 
+from mcphero import _json
 from mcphero.__about__ import __version__
+from mcphero.exceptions import INSTALL_HTTP2, MCPHeroException
 
 PROTOCOL_VERSION = "2025-06-18"
 
+_NO_MESSAGE = object()
+
+_AdapterT = TypeVar("_AdapterT", bound="BaseAdapter")
+
+# Statuses a server plausibly returns for a request sent without a session.
+# Anything else (e.g. 5xx) won't be fixed by initializing, so it isn't retried.
+_INIT_RETRY_STATUS_CODES = frozenset({400, 401, 403, 404, 428})
+
+# Static JSON-RPC payloads. The notification never changes, so it is sent
+# pre-encoded; the tools/list envelope only needs its id appended.
+_INITIALIZED_NOTIFICATION = b'{"jsonrpc":"2.0","method":"notifications/initialized"}'
+_TOOLS_LIST_PREFIX = b'{"jsonrpc":"2.0","method":"tools/list","params":{},"id":'
+
+
+@functools.lru_cache(maxsize=128)
+def _tool_call_prefix(tool_name: str) -> bytes:
+    """Encoded ``tools/call`` envelope up to (and including) ``"arguments":``."""
+    return (
+        b'{"jsonrpc":"2.0","method":"tools/call","params":{"name":'
+        + _json.dumps_bytes(tool_name)
+        + b',"arguments":'
+    )
+
+
+def _encode_tool_call(tool_name: str, arguments: dict, request_id: int) -> bytes:
+    return (
+        _tool_call_prefix(tool_name)
+        + _json.dumps_bytes(arguments)
+        + b'},"id":'
+        + str(request_id).encode()
+        + b"}"
+    )
+
+
+def _is_event_stream(response: httpx.Response) -> bool:
+    # The media type leads the header; parameters like charset follow it.
+    return response.headers.get("content-type", "").startswith("text/event-stream")
+
 
 class InitMode(Enum):
     auto = "auto"
@@ -17,23 +61,50 @@ class InitMode(Enum):
     none = "none"
 
 
+# String values accepted for init_mode, looked up without going through
+# the Enum constructor.
+_INIT_MODES = {mode.value: mode for mode in InitMode}
+
+
 class BaseAdapter:
     """Async HTTP adapter for communicating with an MCP server over Streamable HTTP.
 
     Handles the MCP session lifecycle (initialize + notifications/initialized)
     and provides methods for listing and calling tools via JSON-RPC.
 
+    A single ``httpx.AsyncClient`` is created lazily and reused for every
+    request so connections are kept alive between tool calls. Use the adapter
+    as an async context manager (or call :meth:`aclose`) to release it.
+
     Args:
         base_url: Root URL of the MCP server endpoint.
         timeout: HTTP request timeout in seconds.
         headers: Extra headers merged into every request.
         init_mode: Controls when the MCP session is initialized.
             - "auto"   -- initialize before the first request (default).
-            - "on_fail" -- skip init upfront; if a request fails with an
-              HTTP error and the session hasn't been initialized yet,
-              initialize and retry the request once.
+            - "on_fail" -- skip init upfront; if a request fails with a
+              session-related HTTP error (400, 401, 403, 404 or 428) and the
+              session hasn't been initialized yet, initialize and retry the
+              request once.
             - "none"    -- never auto-initialize; errors propagate as-is.
             Accepts an :class:`InitMode` enum member or its string value.
+        tools_ttl: Seconds to cache the ``tools/list`` result. ``None`` keeps
+            it until :meth:`invalidate_tools_cache` is called; ``0`` disables
+            caching.
+        http2: Negotiate HTTP/2 so concurrent requests are multiplexed over
+            a single connection. Requires the optional ``h2`` dependency:
+            ``pip install "mcphero[http2]"``.
+        max_concurrency: Maximum number of tool calls in flight at once when
+            they are sent as individual requests. Also sizes the client's
+            keep-alive pool so those connections are reused.
+        client: An existing ``httpx.AsyncClient`` to send requests with, e.g.
+            one shared between several adapters. The adapter does not close
+            it, and ``timeout``, ``http2`` and ``max_concurrency`` do not
+            change its settings.
+        strict_init: Always send ``notifications/initialized`` after
+            ``initialize``, as the MCP lifecycle requires. Set to False to
+            skip it when the server did not assign a session id, saving a
+            round trip with stateless servers that ignore the notification.
     """
 
     def __init__(
@@ -43,52 +114,208 @@ class BaseAdapter:
         timeout: float = 30.0,
         headers: dict | None = None,
         init_mode: InitMode | str = InitMode.auto,
+        tools_ttl: float | None = None,
+        http2: bool = False,
+        max_concurrency: int = 10,
+        client: httpx.AsyncClient | None = None,
+        strict_init: bool = True,
     ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if http2:
+            try:
+                import h2  # noqa: F401  # pyright: ignore[reportMissingImports]
+            except ImportError as e:
+                raise ImportError(INSTALL_HTTP2) from e
+
         self.base_url = base_url.rstrip("/")
+        # Parsed once so malformed URLs fail here and httpx doesn't reparse
+        # the string on every request.
+        self._url = httpx.URL(self.base_url)
         self.timeout = timeout
         self.headers = headers or {}
+        # Copy of ``headers`` the cached request headers were built from;
+        # a mismatch means the caller changed them.
+        self._headers_seen: dict | None = None
+        self._active_headers: dict | None = None
         self.init_mode = (
-            InitMode(init_mode) if isinstance(init_mode, str) else init_mode
+            # unknown strings fall through to InitMode() for its ValueError
+            (_INIT_MODES.get(init_mode) or InitMode(init_mode))
+            if isinstance(init_mode, str)
+            else init_mode
         )
         self._session_id: str | None = None
         self._initialize_result: dict | None = None
         self._protocol_version: str | None = None
+        self.tools_ttl = tools_ttl
+        self.strict_init = strict_init
+        self.http2 = http2
+        self.max_concurrency = max_concurrency
+        # Created on first use so it binds to the loop that runs the calls.
+        self._semaphore: asyncio.Semaphore | None = None
+        self._init_lock: asyncio.Lock | None = None
+        self._client = client
+        # Only clients the adapter created itself are closed by aclose().
+        self._owns_client = client is None
+        self._batch_supported: bool | None = None
+        self._id_counter = itertools.count(1)
+        self._tools_cache: dict | None = None
+        self._tools_cached_at = 0.0
+
+    # typing.Self needs Python 3.11; a bound TypeVar keeps subclass types.
+    async def __aenter__(self: _AdapterT) -> _AdapterT:  # noqa: PYI019
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        The client is kept header-neutral: per-request headers (session id,
+        protocol version) are passed on each call, so the connection pool can
+        be reused for the whole lifetime of the adapter.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=30,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections.
+
+        An injected client is left open for its owner to close.
+        """
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    def _next_id(self) -> int:
+        """Return the next JSON-RPC request id, unique within this adapter."""
+        return next(self._id_counter)
+
+    def _request_headers(self) -> dict:
+        """Return the headers for the next request.
+
+        The dict is built once and reused until the session or ``headers``
+        changes, so it must not be mutated by callers.
+        """
+        if self._active_headers is None or self.headers != self._headers_seen:
+            self._headers_seen = dict(self.headers)
+            headers = {
+                "Accept": "application/json, text/event-stream",
+                "Content-Type": "application/json",
+                **self._headers_seen,
+            }
+            if self._session_id:
+                headers["Mcp-Session-Id"] = self._session_id
+            if self._protocol_version:
+                headers["MCP-Protocol-Version"] = self._protocol_version
+            self._active_headers = headers
+        return self._active_headers
 
     @staticmethod
     def _parse_response(response: httpx.Response) -> dict:
         """Parse an HTTP response as JSON or SSE based on Content-Type."""
-        content_type = response.headers.get("content-type", "")
-        if "text/event-stream" in content_type:
-            return BaseAdapter._parse_sse_response(response.text)
-        return response.json()
+        if _is_event_stream(response):
+            return BaseAdapter._parse_sse_response(response.content)
+        return _json.loads(response.content)
+
+    @staticmethod
+    def _parse_sse_response(body: bytes) -> dict:
+        """Extract the last JSON-RPC message from an SSE stream.
+
+        Works on the raw body bytes and scans it backwards with
+        ``bytes.rfind``. Only the last event that carries data is copied
+        out and decoded, so earlier events such as progress notifications
+        are skipped without being parsed. The JSON decoder takes bytes.
+        """
+        if b"\r" in body:
+            body = body.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        end = len(body)
+        while end > 0:
+            # blank line = end of event; the last event may lack one
+            start = body.rfind(b"\n\n", 0, end)
+            data_lines = [
+                # the spec allows exactly one space after the colon
+                line[6 if line[5:6] == b" " else 5 :]
+                for line in body[start + 2 if start >= 0 else 0 : end].split(b"\n")
+                if line[:5] == b"data:"
+            ]
+            if data_lines:
+                return _json.loads(
+                    data_lines[0] if len(data_lines) == 1 else b"\n".join(data_lines)
+                )
+            if start < 0:
+                break
+            end = start
+        raise ValueError("No data field found in SSE response")
 
     @staticmethod
-    def _parse_sse_response(text: str) -> dict:
-        """Extract the last JSON-RPC message from an SSE stream."""
-        data_lines: list[str] = []
-        result = None
-        for line in text.splitlines():
-            if line.startswith("data:"):
-                data_lines.append(line[5:].lstrip(" "))
-            elif line == "":
-                # blank line = end of event
-                if data_lines:
-                    result = json.loads("\n".join(data_lines))
-                    data_lines = []
-        # handle stream that doesn't end with a trailing blank line
+    async def _aiter_sse_events(response: httpx.Response) -> AsyncIterator[Any]:
+        """Yield the JSON payload of each SSE event as the body streams in.
+
+        Only the current line and the current event's data lines are held in
+        memory, so parsing starts before the transport completes.
+        """
+        buffer = bytearray()
+        data_lines: list[bytes] = []
+        async for chunk in response.aiter_bytes(chunk_size=8192):
+            buffer += chunk
+            start = 0
+            while True:
+                end = buffer.find(b"\n", start)
+                if end < 0:
+                    break
+                line = bytes(buffer[start:end]).rstrip(b"\r")
+                start = end + 1
+                if line.startswith(b"data:"):
+                    data_lines.append(line[6 if line[5:6] == b" " else 5 :])
+                elif not line:
+                    # blank line = end of event
+                    if data_lines:
+                        yield _json.loads(b"\n".join(data_lines))
+                        data_lines = []
+            del buffer[:start]
+        # handle stream that doesn't end with a trailing newline
+        line = bytes(buffer).rstrip(b"\r")
+        if line.startswith(b"data:"):
+            data_lines.append(line[6 if line[5:6] == b" " else 5 :])
         if data_lines:
-            result = json.loads("\n".join(data_lines))
-        if result is None:
-            raise ValueError("No data field found in SSE response")
-        return result
+            yield _json.loads(b"\n".join(data_lines))
+
+    async def _aiter_messages(self, response: httpx.Response) -> AsyncIterator[Any]:
+        """Yield each JSON-RPC payload of a streamed response, SSE or JSON."""
+        if _is_event_stream(response):
+            async for message in self._aiter_sse_events(response):
+                yield message
+        else:
+            await response.aread()
+            yield _json.loads(response.content)
 
     async def initialize(self) -> dict:
         if self._initialize_result is not None:
             return self._initialize_result
+        # Concurrent calls (e.g. the individual-call fallback) share one
+        # handshake instead of each opening a session of their own.
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if self._initialize_result is not None:
+                return self._initialize_result
+            return await self._initialize()
 
+    async def _initialize(self) -> dict:
         # Step 1: Send initialize JSON-RPC request
         init_payload = {
-            "id": str(uuid.uuid4()),
+            "id": self._next_id(),
             "jsonrpc": "2.0",
             "method": "initialize",
             "params": {
@@ -101,40 +328,35 @@ class BaseAdapter:
             },
         }
 
-        headers = {
-            "Accept": "application/json, text/event-stream",
-            **self.headers,
-        }
-
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            headers=headers,
-            follow_redirects=True,
-        ) as client:
-            response = await client.post(self.base_url, json=init_payload)
-            response.raise_for_status()
-
-            session_id = response.headers.get("Mcp-Session-Id")
-            if session_id:
-                self._session_id = session_id
-
-            result = self._parse_response(response)
-            self._protocol_version = result.get("result", {}).get(
-                "protocolVersion", PROTOCOL_VERSION
-            )
-            self._initialize_result = result
+        client = self._get_client()
+        response = await client.post(
+            self._url,
+            content=_json.dumps_bytes(init_payload),
+            headers=self._request_headers(),
+        )
+        response.raise_for_status()
 
-            # Step 2: Send notifications/initialized notification
-            notification = {
-                "jsonrpc": "2.0",
-                "method": "notifications/initialized",
-            }
+        session_id = response.headers.get("Mcp-Session-Id")
+        if session_id:
+            self._session_id = session_id
 
-            notify_headers = dict(headers)
-            if self._session_id:
-                notify_headers["Mcp-Session-Id"] = self._session_id
+        result = self._parse_response(response)
+        self._protocol_version = result.get("result", {}).get(
+            "protocolVersion", PROTOCOL_VERSION
+        )
+        self._initialize_result = result
+        self._active_headers = None
 
-            await client.post(self.base_url, json=notification, headers=notify_headers)
+        # Step 2: Send notifications/initialized notification. Without a
+        # session there is no server-side state for it to complete, so
+        # non-strict mode skips it.
+        if not self.strict_init and self._session_id is None:
+            return result
+        await client.post(
+            self._url,
+            content=_INITIALIZED_NOTIFICATION,
+            headers=self._request_headers(),
+        )
 
         return result
 
@@ -142,62 +364,200 @@ class BaseAdapter:
         if self.init_mode == InitMode.auto:
             await self.initialize()
 
-    async def _make_request(
-        self,
-        data: dict,
-        *,
-        _retry: bool = True,
-    ) -> dict:
-        headers = {
-            "Accept": "application/json, text/event-stream",
-            **self.headers,
-        }
-        if self._session_id:
-            headers["Mcp-Session-Id"] = self._session_id
-        if self._protocol_version:
-            headers["MCP-Protocol-Version"] = self._protocol_version
-
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            headers=headers,
-            follow_redirects=True,
-        ) as client:
-            response = await client.post(self.base_url, json=data)
+    async def _post(self, content: bytes) -> httpx.Response:
+        """Send an encoded JSON-RPC payload and return the still-streaming response.
+
+        In ``on_fail`` mode a session-related error before the first
+        initialization triggers :meth:`initialize` and one resend, in this
+        same call. The caller is responsible for closing the returned
+        response.
+        """
+        client = self._get_client()
+        while True:
+            request = client.build_request(
+                "POST",
+                self._url,
+                content=content,
+                headers=self._request_headers(),
+            )
+            response = await client.send(request, stream=True)
 
             try:
                 response.raise_for_status()
             except httpx.HTTPStatusError:
+                await response.aread()
+                await response.aclose()
+                # initialize() sets _initialize_result, so this resends once
                 if (
-                    _retry
-                    and self.init_mode == InitMode.on_fail
+                    self.init_mode == InitMode.on_fail
                     and self._initialize_result is None
+                    and response.status_code in _INIT_RETRY_STATUS_CODES
                 ):
                     await self.initialize()
-                    return await self._make_request(data, _retry=False)
+                    continue
                 raise
-            return self._parse_response(response)
+            return response
+
+    async def _make_request(self, data: dict) -> dict:
+        return await self._request(_json.dumps_bytes(data))
+
+    async def _request(self, content: bytes) -> dict:
+        """Post an encoded JSON-RPC request and return its (last) response."""
+        response = await self._post(content)
+        result: Any = _NO_MESSAGE
+        try:
+            async for result in self._aiter_messages(response):
+                pass
+        finally:
+            await response.aclose()
+        if result is _NO_MESSAGE:
+            raise ValueError("No data field found in SSE response")
+        return result
 
     async def get_mcp_tools(self) -> dict:
+        if self._tools_cache is not None and (
+            self.tools_ttl is None
+            or time.monotonic() - self._tools_cached_at < self.tools_ttl
+        ):
+            return self._tools_cache
+
         await self._ensure_initialized()
-        return await self._make_request(
-            {
-                "id": str(uuid.uuid4()),
-                "jsonrpc": "2.0",
-                "method": "tools/list",
-                "params": {},
-            }
+        result = await self._request(
+            _TOOLS_LIST_PREFIX + str(self._next_id()).encode() + b"}"
         )
+        if "result" in result:
+            self._tools_cache = result
+            self._tools_cached_at = time.monotonic()
+        return result
+
+    def invalidate_tools_cache(self) -> None:
+        """Drop the cached ``tools/list`` result so the next call refetches it."""
+        self._tools_cache = None
 
     async def call_mcp_tool(self, tool_name: str, arguments: dict) -> dict:
         await self._ensure_initialized()
-        return await self._make_request(
-            {
-                "id": str(uuid.uuid4()),
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments,
-                },
-            }
+        return await self._request(
+            _encode_tool_call(tool_name, arguments, self._next_id())
+        )
+
+    async def call_mcp_tools_batch(
+        self,
+        calls: list[tuple[str, dict]],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Call several tools with a single JSON-RPC batch request.
+
+        Results are returned in the same order as ``calls``. If the server
+        rejects batches (an error status, an undecodable body or a non-batch
+        reply), the calls are sent as concurrent individual requests instead,
+        and batching is skipped for the rest of the adapter's lifetime.
+
+        Args:
+            calls: ``(tool_name, arguments)`` pairs.
+            return_exceptions: If True, a failed call is returned as its
+                exception in place of a result instead of being raised.
+
+        Returns:
+            One JSON-RPC response (or exception) per call.
+        """
+        if len(calls) < 2 or self._batch_supported is False:
+            return await self._call_mcp_tools_individually(calls, return_exceptions)
+
+        try:
+            await self._ensure_initialized()
+        except Exception as e:
+            # Same outcome as the per-call path: each call reports the failure.
+            if not return_exceptions:
+                raise
+            return [e] * len(calls)
+
+        request_ids = [self._next_id() for _ in calls]
+        content = (
+            b"["
+            + b",".join(
+                _encode_tool_call(tool_name, arguments, request_id)
+                for (tool_name, arguments), request_id in zip(calls, request_ids)
+            )
+            + b"]"
+        )
+
+        try:
+            messages = await self._read_batch_response(await self._post(content))
+        except Exception as e:
+            # Batching was dropped from MCP in 2025-06-18, so servers reject
+            # the array in many ways: any error status or an undecodable
+            # (e.g. empty 202) reply means "send them one by one".
+            if isinstance(e, (httpx.HTTPStatusError, ValueError)):
+                self._batch_supported = False
+                return await self._call_mcp_tools_individually(calls, return_exceptions)
+            if not return_exceptions:
+                raise
+            return [e] * len(calls)
+
+        by_id = {
+            message.get("id"): message
+            for message in messages
+            if isinstance(message, dict)
+        }
+        if not any(request_id in by_id for request_id in request_ids):
+            # Not a batch reply, e.g. a single "Invalid Request" error.
+            self._batch_supported = False
+            return await self._call_mcp_tools_individually(calls, return_exceptions)
+        self._batch_supported = True
+
+        results: list[Any] = []
+        for request_id in request_ids:
+            message = by_id.get(request_id)
+            if message is None:
+                error = MCPHeroException(
+                    f"No response for JSON-RPC request {request_id!r}"
+                )
+                if not return_exceptions:
+                    raise error
+                results.append(error)
+            else:
+                results.append(message)
+        return results
+
+    async def _read_batch_response(self, response: httpx.Response) -> list:
+        """Collect every message of a (possibly batched) JSON-RPC response.
+
+        Servers may stream batch responses one message per SSE event.
+        """
+        messages: list = []
+        try:
+            async for payload in self._aiter_messages(response):
+                if isinstance(payload, list):
+                    messages.extend(payload)
+                else:
+                    messages.append(payload)
+        finally:
+            await response.aclose()
+        return messages
+
+    async def _call_mcp_tools_individually(
+        self,
+        calls: list[tuple[str, dict]],
+        return_exceptions: bool,
+    ) -> list[Any]:
+        # Issued concurrently, at most max_concurrency at a time, so a large
+        # batch doesn't open more connections than the pool keeps alive.
+        # gather() preserves order.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        semaphore = self._semaphore
+
+        async def call(tool_name: str, arguments: dict) -> dict:
+            async with semaphore:
+                return await self.call_mcp_tool(tool_name, arguments)
+
+        results = await asyncio.gather(
+            *(call(tool_name, arguments) for tool_name, arguments in calls),
+            return_exceptions=True,
         )
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return list(results)
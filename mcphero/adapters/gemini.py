@@ -10,16 +10,33 @@ Requires the optional `google-genai` dependency:
 
 from __future__ import annotations
 
-try:
-    from google.genai import types  # pyright: ignore[reportMissingImports]
-except ImportError as e:
-    from mcphero.exceptions import INSTALL_GOOGLE_GENAI
-
-    raise ImportError(INSTALL_GOOGLE_GENAI) from e
+import functools
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from mcphero.adapters.base_adapter import BaseAdapter
+from mcphero.exceptions import INSTALL_GOOGLE_GENAI
+
+_HTTP_ERR = httpx.HTTPError
+
+if TYPE_CHECKING:
+    from google.genai import types  # pyright: ignore[reportMissingImports]
+
+
+@functools.cache
+def _load_genai_types():
+    """Import ``google.genai.types`` on first use."""
+    try:
+        from google.genai import types  # pyright: ignore[reportMissingImports]
+    except ImportError as e:
+        raise ImportError(INSTALL_GOOGLE_GENAI) from e
+    return types
+
+
+def _gemini_response(result: Any) -> dict:
+    """Function response payload: dicts pass through, anything else is wrapped."""
+    return result if type(result) is dict else {"result": result}
 
 
 class MCPToolAdapterGemini(BaseAdapter):
@@ -59,14 +76,24 @@ class MCPToolAdapterGemini(BaseAdapter):
             # Add results to conversation and continue
     """
 
+    # (raw tools/list response, declarations); rebuilt when the raw changes
+    _gemini_decls_cache: tuple[dict, list[types.FunctionDeclaration]] | None = None
+
     async def get_function_declarations(self) -> list[types.FunctionDeclaration]:
         """
         Fetch tools from MCP server and convert them to Gemini FunctionDeclaration objects.
 
+        The conversion is cached alongside the adapter's tools cache, so
+        repeated calls do not hit the server or rebuild the declarations.
+
         Returns:
             List of FunctionDeclaration objects.
         """
+        types = _load_genai_types()
         mcp_tools = await self.get_mcp_tools()
+        cached = self._gemini_decls_cache
+        if cached is not None and cached[0] is mcp_tools:
+            return list(cached[1])
 
         declarations: list[types.FunctionDeclaration] = []
         for tool in mcp_tools["result"]["tools"]:
@@ -83,7 +110,8 @@ class MCPToolAdapterGemini(BaseAdapter):
             )
             declarations.append(declaration)
 
-        return declarations
+        self._gemini_decls_cache = (mcp_tools, declarations)
+        return list(declarations)
 
     async def get_tool(self) -> types.Tool:
         """
@@ -94,6 +122,7 @@ class MCPToolAdapterGemini(BaseAdapter):
         Returns:
             A Tool object containing all function declarations.
         """
+        types = _load_genai_types()
         declarations = await self.get_function_declarations()
         return types.Tool(function_declarations=declarations)
 
@@ -105,6 +134,9 @@ class MCPToolAdapterGemini(BaseAdapter):
         """
         Process Gemini's function calls to invoke the tools via HTTP.
 
+        All calls are sent to the MCP server as a single JSON-RPC batch
+        request when the server supports it.
+
         Args:
             function_calls: List of FunctionCall objects from the Gemini response.
             return_errors: If True, include error responses for failed calls.
@@ -121,74 +153,11 @@ class MCPToolAdapterGemini(BaseAdapter):
                 contents.append(response.candidates[0].content)  # Model's function call
                 contents.extend(results)  # Function responses
         """
-        if not function_calls:
-            return []
-        results: list[types.Content] = []
-
-        for fc in function_calls:
-            tool_name = fc.name
-            arguments = fc.args if fc.args else {}
-            call_id = getattr(fc, "id", None)
-
-            try:
-                result = await self.call_mcp_tool(tool_name, arguments)
-
-                function_response = types.FunctionResponse(
-                    name=tool_name,
-                    response={"result": result}
-                    if not isinstance(result, dict)
-                    else result,
-                    id=call_id,
-                )
-
-                content = types.Content(
-                    role="user",
-                    parts=[
-                        types.Part.from_function_response(
-                            name=function_response.name,
-                            response=function_response.response,
-                        )
-                    ],
-                )
-                results.append(content)
-
-            except httpx.HTTPError as e:
-                if return_errors:
-                    function_response = types.FunctionResponse(
-                        name=tool_name,
-                        response={"error": f"HTTP error calling tool: {str(e)}"},
-                        id=call_id,
-                    )
-                    content = types.Content(
-                        role="user",
-                        parts=[
-                            types.Part.from_function_response(
-                                name=function_response.name,
-                                response=function_response.response,
-                            )
-                        ],
-                    )
-                    results.append(content)
-
-            except Exception as e:
-                if return_errors:
-                    function_response = types.FunctionResponse(
-                        name=tool_name,
-                        response={"error": f"Unexpected error: {str(e)}"},
-                        id=call_id,
-                    )
-                    content = types.Content(
-                        role="user",
-                        parts=[
-                            types.Part.from_function_response(
-                                name=function_response.name,
-                                response=function_response.response,
-                            )
-                        ],
-                    )
-                    results.append(content)
-
-        return results
+        types = _load_genai_types()
+        parts = await self.process_function_calls_as_parts(
+            function_calls, return_errors=return_errors
+        )
+        return [types.Content(role="user", parts=[part]) for part in parts]
 
     async def process_function_calls_as_parts(
         self,
@@ -214,40 +183,30 @@ class MCPToolAdapterGemini(BaseAdapter):
             # Combine into single Content:
             contents.append(types.Content(role="user", parts=parts))
         """
+        types = _load_genai_types()
         if not function_calls:
             return []
+        outcomes = await self.call_mcp_tools_batch(
+            [(fc.name, fc.args if fc.args else {}) for fc in function_calls],
+            return_exceptions=True,
+        )
         results: list[types.Part] = []
 
-        for fc in function_calls:
-            tool_name = fc.name
-            arguments = fc.args if fc.args else {}
-
-            try:
-                result = await self.call_mcp_tool(tool_name, arguments)
-
-                part = types.Part.from_function_response(
-                    name=tool_name,
-                    response={"result": result}
-                    if not isinstance(result, dict)
-                    else result,
-                )
-                results.append(part)
-
-            except httpx.HTTPError as e:
-                if return_errors:
-                    part = types.Part.from_function_response(
-                        name=tool_name,
-                        response={"error": f"HTTP error calling tool: {str(e)}"},
-                    )
-                    results.append(part)
-
-            except Exception as e:
-                if return_errors:
-                    part = types.Part.from_function_response(
-                        name=tool_name,
-                        response={"error": f"Unexpected error: {str(e)}"},
-                    )
-                    results.append(part)
+        for fc, result in zip(function_calls, outcomes):
+            if isinstance(result, _HTTP_ERR):
+                if not return_errors:
+                    continue
+                response = {"error": f"HTTP error calling tool: {str(result)}"}
+            elif isinstance(result, Exception):
+                if not return_errors:
+                    continue
+                response = {"error": f"Unexpected error: {str(result)}"}
+            else:
+                response = _gemini_response(result)
+
+            results.append(
+                types.Part.from_function_response(name=fc.name, response=response)
+            )
 
         return results
 
@@ -266,6 +225,7 @@ class MCPToolAdapterGemini(BaseAdapter):
         Returns:
             A Content object that can be appended to the conversation.
         """
+        types = _load_genai_types()
         return types.Content(
             role="user",
             parts=[types.Part.from_function_response(name=name, response=response)],
@@ -7,17 +7,30 @@ and processes OpenAI's tool calls to HTTP requests to the MCP server.
 
 from __future__ import annotations
 
-import json
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from openai.types.chat import (
-    ChatCompletionMessageToolCall,
-    ChatCompletionToolMessageParam,
-    ChatCompletionToolParam,
-)
 
+from mcphero import _json
 from mcphero.adapters.base_adapter import BaseAdapter
 
+# Looked up once instead of on every iteration of the result loop.
+_HTTP_ERR = httpx.HTTPError
+
+if TYPE_CHECKING:
+    # Only needed for annotations; the tool schemas and messages are plain
+    # dicts at runtime, so importing the openai package can be skipped.
+    from openai.types.chat import (
+        ChatCompletionMessageToolCall,
+        ChatCompletionToolMessageParam,
+        ChatCompletionToolParam,
+    )
+
+
+def _openai_content(result: Any) -> str:
+    """Tool message content: strings pass through, anything else is JSON."""
+    return result if type(result) is str else _json.dumps(result)
+
 
 class MCPToolAdapterOpenAI(BaseAdapter):
     """
@@ -61,10 +74,16 @@ class MCPToolAdapterOpenAI(BaseAdapter):
             )
     """
 
+    # (raw tools/list response, converted tools); rebuilt when the raw changes
+    _openai_tools_cache: tuple[dict, list[ChatCompletionToolParam]] | None = None
+
     async def get_tool_definitions(self) -> list[ChatCompletionToolParam]:
         """
         Fetch tools from MCP server and convert them to OpenAI tool schemas.
 
+        The conversion is cached alongside the adapter's tools cache, so
+        repeated calls do not hit the server or rebuild the schemas.
+
         Returns:
             List of tool definitions compatible with OpenAI's `tools` parameter.
 
@@ -78,6 +97,9 @@ class MCPToolAdapterOpenAI(BaseAdapter):
             )
         """
         mcp_tools = await self.get_mcp_tools()
+        cached = self._openai_tools_cache
+        if cached is not None and cached[0] is mcp_tools:
+            return list(cached[1])
 
         openai_tools: list[ChatCompletionToolParam] = []
         for tool in mcp_tools["result"]["tools"]:
@@ -98,7 +120,8 @@ class MCPToolAdapterOpenAI(BaseAdapter):
                 }
             )
 
-        return openai_tools
+        self._openai_tools_cache = (mcp_tools, openai_tools)
+        return list(openai_tools)
 
     async def process_tool_calls(
         self,
@@ -108,6 +131,9 @@ class MCPToolAdapterOpenAI(BaseAdapter):
         """
         Process OpenAI's tool_calls by invoking the tools via HTTP.
 
+        All calls with valid arguments are sent to the MCP server as a single
+        JSON-RPC batch request when the server supports it.
+
         Args:
             tool_calls: List of tool calls from `response.choices[0].message.tool_calls`.
             return_errors: If True, include error messages for failed calls.
@@ -135,61 +161,76 @@ class MCPToolAdapterOpenAI(BaseAdapter):
         """
         if not tool_calls:
             return []
-        results: list[ChatCompletionToolMessageParam] = []
 
+        # Parse every call's arguments upfront so the valid ones can be sent
+        # to the MCP server as a single JSON-RPC batch.
+        parsed: list[tuple[ChatCompletionMessageToolCall, bool, dict]] = []
         for tool_call in tool_calls:
-            tool_name = tool_call.function.name
-
             try:
-                arguments = json.loads(tool_call.function.arguments)
-            except json.JSONDecodeError:
+                arguments = _json.loads(tool_call.function.arguments)
+            except _json.JSONDecodeError:
+                parsed.append((tool_call, False, {}))
+            else:
+                parsed.append((tool_call, True, arguments))
+
+        outcomes = iter(
+            await self.call_mcp_tools_batch(
+                [
+                    (tool_call.function.name, arguments)
+                    for tool_call, ok, arguments in parsed
+                    if ok
+                ],
+                return_exceptions=True,
+            )
+        )
+
+        results: list[ChatCompletionToolMessageParam] = []
+        for tool_call, ok, _ in parsed:
+            if not ok:
                 if return_errors:
                     results.append(
                         {
                             "tool_call_id": tool_call.id,
                             "role": "tool",
-                            "content": json.dumps(
+                            "content": _json.dumps(
                                 {"error": "Failed to parse tool arguments"}
                             ),
                         }
                     )
                 continue
 
-            try:
-                result = await self.call_mcp_tool(tool_name, arguments)
-
-                results.append(
-                    {
-                        "tool_call_id": tool_call.id,
-                        "role": "tool",
-                        "content": json.dumps(result)
-                        if not isinstance(result, str)
-                        else result,
-                    }
-                )
-
-            except httpx.HTTPError as e:
+            result = next(outcomes)
+            if isinstance(result, _HTTP_ERR):
                 if return_errors:
                     results.append(
                         {
                             "tool_call_id": tool_call.id,
                             "role": "tool",
-                            "content": json.dumps(
-                                {"error": f"HTTP error calling tool: {str(e)}"}
+                            "content": _json.dumps(
+                                {"error": f"HTTP error calling tool: {str(result)}"}
                             ),
                         }
                     )
 
-            except Exception as e:
+            elif isinstance(result, Exception):
                 if return_errors:
                     results.append(
                         {
                             "tool_call_id": tool_call.id,
                             "role": "tool",
-                            "content": json.dumps(
-                                {"error": f"Unexpected error: {str(e)}"}
+                            "content": _json.dumps(
+                                {"error": f"Unexpected error: {str(result)}"}
                             ),
                         }
                     )
 
+            else:
+                results.append(
+                    {
+                        "tool_call_id": tool_call.id,
+                        "role": "tool",
+                        "content": _openai_content(result),
+                    }
+                )
+
         return results
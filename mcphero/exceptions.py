@@ -7,3 +7,10 @@ To use Google Gemini with mcphero, please install dependencies:
 
 pip install "mcphero[google-genai]"
 """
+
+
+INSTALL_HTTP2 = """
+To use HTTP/2 with mcphero, please install dependencies:
+
+pip install "mcphero[http2]"
+"""
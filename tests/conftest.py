@@ -1,7 +1,36 @@
+import asyncio
+import functools
+import json
+
+import httpx
 import pytest
+import pytest_asyncio
+import respx
+from openai.types.chat import ChatCompletionMessageToolCall
+from openai.types.chat.chat_completion_message_tool_call import Function
 
+try:
+    import uvloop
+except ImportError:  # not installed, or unsupported platform (Windows)
+    uvloop = None
 
-@pytest.fixture
+
+def pytest_configure(config):
+    # Import the adapters once up front, so tests that reach them through the
+    # package's lazy attributes find the modules already in sys.modules.
+    import mcphero.adapters.gemini
+    import mcphero.adapters.openai  # noqa: F401
+
+
+if uvloop is not None:
+    # Only pytest-asyncio >= 1.4 defines this hook; older releases ignore it.
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests and fixtures on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
 def sample_mcp_tools():
     """Sample MCP tool definitions as returned by a server."""
     return [
@@ -29,7 +58,7 @@ def sample_mcp_tools():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_mcp_tool_no_schema():
     """MCP tool without inputSchema."""
     return [
@@ -40,12 +69,167 @@ def sample_mcp_tool_no_schema():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tool_result():
     """Sample successful tool call result."""
     return {"temperature": 72, "unit": "fahrenheit", "description": "Sunny"}
 
 
-@pytest.fixture
+# Encoded once per session, so mocked responses can take ``content=`` and
+# skip re-serializing the same payload in every test.
+@pytest.fixture(scope="session")
+def sample_tools_list_bytes(sample_mcp_tools):
+    """A tools/list result for ``sample_mcp_tools``, as a JSON body."""
+    return json.dumps({"result": {"tools": sample_mcp_tools}}).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_tools_list_no_schema_bytes(sample_mcp_tool_no_schema):
+    """A tools/list result for ``sample_mcp_tool_no_schema``, as a JSON body."""
+    return json.dumps({"result": {"tools": sample_mcp_tool_no_schema}}).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_tool_result_bytes(sample_tool_result):
+    """``sample_tool_result`` as a JSON body."""
+    return json.dumps(sample_tool_result).encode()
+
+
+@functools.cache
+def _tool_call(
+    call_id: str, name: str, arguments: str
+) -> ChatCompletionMessageToolCall:
+    return ChatCompletionMessageToolCall(
+        id=call_id, type="function", function=Function(name=name, arguments=arguments)
+    )
+
+
+@pytest.fixture(scope="session")
+def tool_call_factory():
+    """Build an OpenAI tool call; identical calls share one (read-only) object.
+
+    ``args`` is JSON-encoded unless it is already a string, which lets tests
+    pass malformed arguments through verbatim.
+    """
+
+    def factory(call_id: str, name: str, args) -> ChatCompletionMessageToolCall:
+        arguments = args if isinstance(args, str) else json.dumps(args, sort_keys=True)
+        return _tool_call(call_id, name, arguments)
+
+    return factory
+
+
+@pytest.fixture(scope="session")
 def base_url():
     return "https://api.mcphero.app/mcp/test-server"
+
+
+@pytest.fixture(scope="session")
+def base_url_parsed(base_url):
+    """``base_url`` parsed once, so route patterns don't reparse the string."""
+    return httpx.URL(base_url)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_async_client():
+    """One HTTP client reused by every test that injects it into an adapter."""
+    async with httpx.AsyncClient(
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=httpx.Timeout(10.0, connect=2.0),
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def mcp_router(base_url_parsed):
+    """One respx router for the session, routing the MCP endpoint URL.
+
+    Mocking at the httpx transport level keeps requests from the shared
+    client out of the httpcore connection pool entirely.
+    """
+    with respx.mock(assert_all_called=False, using="httpx") as router:
+        router.post(url=base_url_parsed, name="mcp")
+        yield router
+
+
+@pytest.fixture
+def mcp_route(mcp_router):
+    """The shared MCP route; tests set its side_effect or return_value."""
+    route = mcp_router.routes["mcp"]
+    yield route
+    route.side_effect = None
+    route.return_value = None
+    mcp_router.reset()
+
+
+# Session-scoped adapters the test modules share; see _reset_shared_adapters.
+SHARED_ADAPTER_FIXTURES = ("adapter", "openai_adapter")
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_adapters(request):
+    """Drop per-test state a shared adapter picked up from the previous test."""
+    yield
+    for name in SHARED_ADAPTER_FIXTURES:
+        if name in request.fixturenames:
+            adapter = request.getfixturevalue(name)
+            adapter.invalidate_tools_cache()
+            # Nothing public forgets batch support; the next batch re-probes.
+            adapter._batch_supported = None
+
+
+def _echo_tool_name(message: dict) -> dict:
+    return {"jsonrpc": "2.0", "id": message["id"], "result": message["params"]["name"]}
+
+
+def _echo_reply(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    if isinstance(payload, list):
+        return httpx.Response(200, json=[_echo_tool_name(m) for m in payload])
+    return httpx.Response(200, json=_echo_tool_name(payload))
+
+
+def _is_batch(request: httpx.Request) -> bool:
+    return isinstance(json.loads(request.content), list)
+
+
+def _batch_rejecting_reply(request: httpx.Request) -> httpx.Response:
+    if _is_batch(request):
+        return httpx.Response(400, text="Batch not supported")
+    return _echo_reply(request)
+
+
+@pytest.fixture(scope="session")
+def echo_reply():
+    """A side effect answering each tools/call, batched or not, with its name."""
+    return _echo_reply
+
+
+@pytest.fixture(scope="session")
+def batch_rejecting_reply():
+    """Like ``echo_reply``, but a server that rejects batches with a 400."""
+    return _batch_rejecting_reply
+
+
+class InFlightReply:
+    """Batch-rejecting side effect recording the peak of concurrent calls."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if _is_batch(request):
+            return httpx.Response(400, text="Batch not supported")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return _echo_reply(request)
+
+
+@pytest.fixture
+def in_flight_reply():
+    """A fresh ``InFlightReply`` per test."""
+    return InFlightReply()
@@ -1,94 +1,117 @@
+from __future__ import annotations
+
+import asyncio
 import json
+import sys
 
 import httpx
 import pytest
-import respx
 
+from mcphero import _json
 from mcphero.__about__ import __version__
 from mcphero.adapters.base_adapter import PROTOCOL_VERSION, BaseAdapter, InitMode
+from mcphero.exceptions import INSTALL_HTTP2, MCPHeroException
+
+INIT_RESULT = {
+    "jsonrpc": "2.0",
+    "id": "1",
+    "result": {"protocolVersion": PROTOCOL_VERSION},
+}
+INIT_RESULT_FULL = {
+    "jsonrpc": "2.0",
+    "id": "1",
+    "result": {
+        "protocolVersion": PROTOCOL_VERSION,
+        "capabilities": {},
+        "serverInfo": {"name": "test-server", "version": "1.0"},
+    },
+}
+TOOLS_RESULT = {"jsonrpc": "2.0", "id": "2", "result": {"tools": []}}
+CALL_RESULT = {
+    "jsonrpc": "2.0",
+    "id": "2",
+    "result": {"content": [{"type": "text", "text": "hello"}]},
+}
+
+
+PROGRESS_NOTIFICATION = {"jsonrpc": "2.0", "method": "notifications/progress"}
+EMPTY_RESULT = {"jsonrpc": "2.0", "id": "1", "result": {}}
+DONE_RESULT = {"jsonrpc": "2.0", "id": "1", "result": {"done": True}}
+
+
+def _sse_body(payload: dict) -> bytes:
+    """Format a dict as an SSE event body, ready to pass as ``content=``."""
+    return b"event: message\ndata: " + json.dumps(payload).encode() + b"\n\n"
+
+
+# Serialized once; tests that reuse a payload slice these instead of
+# re-encoding it. Tests stick to stdlib json since orjson is optional.
+SSE_INIT_FULL = _sse_body(INIT_RESULT_FULL)
+SSE_PROGRESS = _sse_body(PROGRESS_NOTIFICATION)
+SSE_EMPTY_RESULT = _sse_body(EMPTY_RESULT)
+SSE_DONE_RESULT = _sse_body(DONE_RESULT)
+
+# Pre-serialized bodies for the common replies; the factories below wrap
+# them in a fresh httpx.Response per use without re-encoding the JSON.
+INIT_RESULT_BYTES = json.dumps(INIT_RESULT).encode()
+INIT_RESULT_FULL_BYTES = json.dumps(INIT_RESULT_FULL).encode()
+TOOLS_RESULT_BYTES = json.dumps(TOOLS_RESULT).encode()
+CALL_RESULT_BYTES = json.dumps(CALL_RESULT).encode()
+EMPTY_RESULT_BYTES = json.dumps(EMPTY_RESULT).encode()
+
+
+def _json_response(body: bytes, headers: dict | None = None) -> httpx.Response:
+    """A 200 JSON response around an already-encoded body."""
+    return httpx.Response(
+        200,
+        content=body,
+        headers={"content-type": "application/json", **(headers or {})},
+    )
+
+
+def _init_response(
+    session_id: str | None = "s1", body: bytes = INIT_RESULT_BYTES
+) -> httpx.Response:
+    """An initialize reply, with an Mcp-Session-Id header unless None."""
+    return _json_response(body, {"Mcp-Session-Id": session_id} if session_id else None)
+
+
+def _capturing(captured: list, *responses: httpx.Response):
+    """A side_effect replying with ``responses`` in order.
+
+    Records the decoded body and headers of each request into ``captured``
+    as it arrives, so tests assert on those rather than on ``route.calls``.
+    """
+    replies = iter(responses)
+
+    def side_effect(request: httpx.Request) -> httpx.Response:
+        captured.append(
+            {"body": _json.loads(request.content), "headers": request.headers}
+        )
+        return next(replies)
 
-
-def _sse_body(payload: dict) -> str:
-    """Format a dict as an SSE event body."""
-    return f"event: message\ndata: {json.dumps(payload)}\n\n"
-
-
-class TestBaseAdapterInit:
-    def test_stores_base_url(self, base_url):
-        adapter = BaseAdapter(base_url)
-        assert adapter.base_url == base_url
-
-    def test_strips_trailing_slash(self):
-        adapter = BaseAdapter("https://example.com/")
-        assert adapter.base_url == "https://example.com"
-
-    def test_default_timeout(self, base_url):
-        adapter = BaseAdapter(base_url)
-        assert adapter.timeout == 30.0
-
-    def test_custom_timeout(self, base_url):
-        adapter = BaseAdapter(base_url, timeout=60.0)
-        assert adapter.timeout == 60.0
-
-    def test_default_headers(self, base_url):
-        adapter = BaseAdapter(base_url)
-        assert adapter.headers == {}
-
-    def test_custom_headers(self, base_url):
-        headers = {"Authorization": "Bearer token"}
-        adapter = BaseAdapter(base_url, headers=headers)
-        assert adapter.headers == headers
-
-    def test_initial_session_state(self, base_url):
-        adapter = BaseAdapter(base_url)
-        assert adapter._session_id is None
-        assert adapter._initialize_result is None
-        assert adapter._protocol_version is None
-
-    def test_default_init_mode_is_auto(self, base_url):
-        adapter = BaseAdapter(base_url)
-        assert adapter.init_mode == InitMode.auto
-
-    def test_accepts_string_init_mode(self, base_url):
-        adapter = BaseAdapter(base_url, init_mode="on_fail")
-        assert adapter.init_mode == InitMode.on_fail
-
-    def test_accepts_enum_init_mode(self, base_url):
-        adapter = BaseAdapter(base_url, init_mode=InitMode.none)
-        assert adapter.init_mode == InitMode.none
+    return side_effect
 
 
 class TestInitialize:
-    @respx.mock
-    async def test_sends_initialize_request(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {
-                "protocolVersion": PROTOCOL_VERSION,
-                "capabilities": {},
-                "serverInfo": {"name": "test-server", "version": "1.0"},
-            },
-        }
-        init_route = respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "srv-session-123"}),
-                httpx.Response(202),
-            ]
+    async def test_sends_initialize_request(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        captured = []
+        mcp_route.side_effect = _capturing(
+            captured,
+            _init_response("srv-session-123", INIT_RESULT_FULL_BYTES),
+            httpx.Response(202),
         )
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         result = await adapter.initialize()
 
-        assert result == init_result
-        assert init_route.call_count == 2
+        assert result == INIT_RESULT_FULL
+        assert len(captured) == 2
 
         # Verify the initialize request payload
-        first_call = init_route.calls[0]
-        body = first_call.request.content
-        import json
-
-        payload = json.loads(body)
+        payload = captured[0]["body"]
         assert payload["jsonrpc"] == "2.0"
         assert payload["method"] == "initialize"
         assert payload["params"]["protocolVersion"] == PROTOCOL_VERSION
@@ -96,430 +119,435 @@ class TestInitialize:
         assert payload["params"]["clientInfo"]["version"] == __version__
         assert payload["params"]["capabilities"] == {}
 
-    @respx.mock
-    async def test_extracts_session_id_from_response(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "my-session-42"}),
-                httpx.Response(202),
-            ]
-        )
+    async def test_extracts_session_id_from_response(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            _init_response("my-session-42"),
+            httpx.Response(202),
+        ]
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         await adapter.initialize()
 
         assert adapter._session_id == "my-session-42"
 
-    @respx.mock
-    async def test_sends_initialized_notification(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        route = respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "sess-1"}),
-                httpx.Response(202),
-            ]
+    async def test_sends_initialized_notification(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        captured = []
+        mcp_route.side_effect = _capturing(
+            captured, _init_response("sess-1"), httpx.Response(202)
         )
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         await adapter.initialize()
 
         # Second call should be the notification
-        import json
-
-        second_call = route.calls[1]
-        payload = json.loads(second_call.request.content)
+        payload = captured[1]["body"]
         assert payload["jsonrpc"] == "2.0"
         assert payload["method"] == "notifications/initialized"
         assert "id" not in payload
 
-    @respx.mock
-    async def test_notification_includes_session_id_header(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        route = respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "sess-abc"}),
-                httpx.Response(202),
-            ]
+    async def test_notification_includes_session_id_header(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        captured = []
+        mcp_route.side_effect = _capturing(
+            captured, _init_response("sess-abc"), httpx.Response(202)
         )
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         await adapter.initialize()
 
-        second_call = route.calls[1]
-        assert second_call.request.headers.get("Mcp-Session-Id") == "sess-abc"
+        assert captured[1]["headers"].get("Mcp-Session-Id") == "sess-abc"
 
-    @respx.mock
-    async def test_idempotent_returns_cached_result(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        route = respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "sess-1"}),
-                httpx.Response(202),
-            ]
-        )
+    async def test_idempotent_returns_cached_result(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            _init_response("sess-1"),
+            httpx.Response(202),
+        ]
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         result1 = await adapter.initialize()
         result2 = await adapter.initialize()
 
         assert result1 == result2
         # Only 2 calls total (init + notification), not 4
-        assert route.call_count == 2
+        assert mcp_route.call_count == 2
 
-    @respx.mock
-    async def test_works_without_session_id(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result),
-                httpx.Response(202),
-            ]
-        )
+    async def test_works_without_session_id(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            _init_response(None),
+            httpx.Response(202),
+        ]
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         result = await adapter.initialize()
 
-        assert result == init_result
+        assert result == INIT_RESULT
         assert adapter._session_id is None
 
-    @respx.mock
-    async def test_stores_negotiated_protocol_version(self, base_url):
+    async def test_non_strict_skips_notification_without_session(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [_init_response(None)]
+
+        adapter = BaseAdapter(base_url, client=shared_async_client, strict_init=False)
+        result = await adapter.initialize()
+
+        assert result == INIT_RESULT
+        assert mcp_route.call_count == 1
+
+    async def test_non_strict_sends_notification_with_session(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [_init_response("s1"), httpx.Response(202)]
+
+        adapter = BaseAdapter(base_url, client=shared_async_client, strict_init=False)
+        await adapter.initialize()
+
+        assert mcp_route.call_count == 2
+
+    async def test_stores_negotiated_protocol_version(
+        self, base_url, shared_async_client, mcp_route
+    ):
         init_result = {
             "jsonrpc": "2.0",
             "id": "1",
             "result": {"protocolVersion": "2024-11-05"},
         }
-        respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result),
-                httpx.Response(202),
-            ]
-        )
+        mcp_route.side_effect = [
+            httpx.Response(200, json=init_result),
+            httpx.Response(202),
+        ]
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         await adapter.initialize()
 
         assert adapter._protocol_version == "2024-11-05"
 
 
 class TestMakeRequest:
-    @respx.mock
-    async def test_post_returns_parsed_json(self, base_url):
+    async def test_post_returns_parsed_json(
+        self, base_url, shared_async_client, mcp_route
+    ):
         expected = {"jsonrpc": "2.0", "id": "1", "result": {"tools": []}}
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json=expected)
-        )
+        mcp_route.return_value = httpx.Response(200, json=expected)
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         result = await adapter._make_request(
             {"id": "1", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
         )
         assert result == expected
 
-    @respx.mock
-    async def test_http_error_raises(self, base_url):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(500, text="Internal Server Error")
-        )
+    async def test_sends_json_encoded_body(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = _json_response(EMPTY_RESULT_BYTES)
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
+        data = {"id": "1", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
+        await adapter._make_request(data)
+
+        request = mcp_route.calls[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert _json.loads(request.content) == data
+
+    async def test_http_error_raises(self, base_url, shared_async_client, mcp_route):
+        mcp_route.return_value = httpx.Response(500, text="Internal Server Error")
+
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         with pytest.raises(httpx.HTTPStatusError):
             await adapter._make_request(
                 {"id": "1", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
             )
 
-    @respx.mock
-    async def test_no_session_id_header_before_init(self, base_url):
-        route = respx.post(base_url).mock(
-            return_value=httpx.Response(200, json={"jsonrpc": "2.0", "id": "1", "result": {}})
-        )
+    async def test_no_session_id_header_before_init(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = _json_response(EMPTY_RESULT_BYTES)
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         await adapter._make_request(
             {"id": "1", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
         )
 
-        request = route.calls[0].request
+        request = mcp_route.calls[0].request
         assert "Mcp-Session-Id" not in request.headers
 
-    @respx.mock
-    async def test_includes_session_id_after_init(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "sess-xyz"}),
-                httpx.Response(202),
-            ]
-        )
-
-        adapter = BaseAdapter(base_url)
+    async def test_includes_session_id_after_init(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            _init_response("sess-xyz"),
+            httpx.Response(202),
+            # the subsequent request
+            httpx.Response(200, json={"jsonrpc": "2.0", "id": "2", "result": {}}),
+        ]
+
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         await adapter.initialize()
-
-        # Now mock a subsequent request
-        respx.reset()
-        route = respx.post(base_url).mock(
-            return_value=httpx.Response(200, json={"jsonrpc": "2.0", "id": "2", "result": {}})
-        )
-
         await adapter._make_request(
             {"id": "2", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
         )
 
-        request = route.calls[0].request
+        request = mcp_route.calls[2].request
         assert request.headers.get("Mcp-Session-Id") == "sess-xyz"
 
-    @respx.mock
-    async def test_includes_protocol_version_after_init(self, base_url):
+    async def test_includes_protocol_version_after_init(
+        self, base_url, shared_async_client, mcp_route
+    ):
         init_result = {
             "jsonrpc": "2.0",
             "id": "1",
             "result": {"protocolVersion": "2024-11-05"},
         }
-        respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result),
-                httpx.Response(202),
-            ]
-        )
+        mcp_route.side_effect = [
+            httpx.Response(200, json=init_result),
+            httpx.Response(202),
+            httpx.Response(200, json={"jsonrpc": "2.0", "id": "2", "result": {}}),
+        ]
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         await adapter.initialize()
-
-        respx.reset()
-        route = respx.post(base_url).mock(
-            return_value=httpx.Response(200, json={"jsonrpc": "2.0", "id": "2", "result": {}})
-        )
-
         await adapter._make_request(
             {"id": "2", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
         )
 
-        request = route.calls[0].request
+        request = mcp_route.calls[2].request
         assert request.headers.get("MCP-Protocol-Version") == "2024-11-05"
 
 
 class TestInitModeAuto:
-    @respx.mock
-    async def test_get_mcp_tools_calls_initialize_before_request(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        tools_result = {
-            "jsonrpc": "2.0",
-            "id": "2",
-            "result": {"tools": []},
-        }
-        route = respx.post(base_url).mock(
-            side_effect=[
-                # initialize request
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "s1"}),
-                # notifications/initialized
-                httpx.Response(202),
-                # tools/list request
-                httpx.Response(200, json=tools_result),
-            ]
-        )
-
-        adapter = BaseAdapter(base_url, init_mode=InitMode.auto)
+    async def test_get_mcp_tools_calls_initialize_before_request(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            # initialize request
+            _init_response(),
+            # notifications/initialized
+            httpx.Response(202),
+            # tools/list request
+            _json_response(TOOLS_RESULT_BYTES),
+        ]
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.auto, client=shared_async_client
+        )
         result = await adapter.get_mcp_tools()
 
-        assert result == tools_result
+        assert result == TOOLS_RESULT
         # 3 calls: initialize, notification, tools/list
-        assert route.call_count == 3
-
-    @respx.mock
-    async def test_call_mcp_tool_calls_initialize_before_request(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        call_result = {
-            "jsonrpc": "2.0",
-            "id": "2",
-            "result": {"content": [{"type": "text", "text": "hello"}]},
-        }
-        route = respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "s1"}),
-                httpx.Response(202),
-                httpx.Response(200, json=call_result),
-            ]
+        assert mcp_route.call_count == 3
+
+    async def test_call_mcp_tool_calls_initialize_before_request(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            _init_response(),
+            httpx.Response(202),
+            _json_response(CALL_RESULT_BYTES),
+        ]
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.auto, client=shared_async_client
         )
-
-        adapter = BaseAdapter(base_url, init_mode=InitMode.auto)
         result = await adapter.call_mcp_tool("test_tool", {"arg": "val"})
 
-        assert result == call_result
-        assert route.call_count == 3
+        assert result == CALL_RESULT
+        assert mcp_route.call_count == 3
 
 
 class TestInitModeOnFail:
-    @respx.mock
-    async def test_does_not_call_initialize_upfront(self, base_url):
-        tools_result = {
-            "jsonrpc": "2.0",
-            "id": "2",
-            "result": {"tools": []},
-        }
-        route = respx.post(base_url).mock(
-            return_value=httpx.Response(200, json=tools_result),
-        )
+    async def test_does_not_call_initialize_upfront(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = _json_response(TOOLS_RESULT_BYTES)
 
-        adapter = BaseAdapter(base_url, init_mode=InitMode.on_fail)
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.on_fail, client=shared_async_client
+        )
         result = await adapter.get_mcp_tools()
 
-        assert result == tools_result
+        assert result == TOOLS_RESULT
         # Only 1 call: the tools/list request, no init
-        assert route.call_count == 1
-
-    @respx.mock
-    async def test_initializes_and_retries_on_failure(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        tools_result = {
-            "jsonrpc": "2.0",
-            "id": "2",
-            "result": {"tools": []},
-        }
-        route = respx.post(base_url).mock(
-            side_effect=[
-                # First tools/list fails
-                httpx.Response(400, text="Bad Request"),
-                # initialize request
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "s1"}),
-                # notifications/initialized
-                httpx.Response(202),
-                # Retry tools/list succeeds
-                httpx.Response(200, json=tools_result),
-            ]
-        )
-
-        adapter = BaseAdapter(base_url, init_mode=InitMode.on_fail)
+        assert mcp_route.call_count == 1
+
+    async def test_initializes_and_retries_on_failure(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            # First tools/list fails
+            httpx.Response(400, text="Bad Request"),
+            # initialize request
+            _init_response(),
+            # notifications/initialized
+            httpx.Response(202),
+            # Retry tools/list succeeds
+            _json_response(TOOLS_RESULT_BYTES),
+        ]
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.on_fail, client=shared_async_client
+        )
         result = await adapter.get_mcp_tools()
 
-        assert result == tools_result
+        assert result == TOOLS_RESULT
         # 4 calls: failed tools/list, init, notification, retry tools/list
-        assert route.call_count == 4
-
-    @respx.mock
-    async def test_no_retry_if_already_initialized(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        # Pre-initialize the adapter
-        respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "s1"}),
-                httpx.Response(202),
-            ]
+        assert mcp_route.call_count == 4
+
+    async def test_retry_resends_same_body_with_session(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            httpx.Response(404, text="Session not found"),
+            _init_response("s1"),
+            httpx.Response(202),
+            _json_response(CALL_RESULT_BYTES),
+        ]
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.on_fail, client=shared_async_client
         )
+        result = await adapter.call_mcp_tool("test_tool", {"arg": "val"})
 
-        adapter = BaseAdapter(base_url, init_mode=InitMode.on_fail)
-        await adapter.initialize()
+        assert result == CALL_RESULT
+        failed, retried = mcp_route.calls[0].request, mcp_route.calls[3].request
+        assert retried.content == failed.content
+        assert "Mcp-Session-Id" not in failed.headers
+        assert retried.headers["Mcp-Session-Id"] == "s1"
 
-        respx.reset()
-        # Now a request fails — should NOT retry since already initialized
-        respx.post(base_url).mock(
-            return_value=httpx.Response(400, text="Bad Request"),
+    async def test_no_retry_on_server_error(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(500, text="Internal Server Error")
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.on_fail, client=shared_async_client
         )
 
         with pytest.raises(httpx.HTTPStatusError):
             await adapter.get_mcp_tools()
 
-    @respx.mock
-    async def test_error_propagates_if_retry_also_fails(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {"protocolVersion": PROTOCOL_VERSION},
-        }
-        route = respx.post(base_url).mock(
-            side_effect=[
-                # First tools/list fails
-                httpx.Response(400, text="Bad Request"),
-                # initialize succeeds
-                httpx.Response(200, json=init_result, headers={"Mcp-Session-Id": "s1"}),
-                # notifications/initialized
-                httpx.Response(202),
-                # Retry tools/list also fails
-                httpx.Response(500, text="Internal Server Error"),
-            ]
+        # Only the failed request; a 5xx does not trigger init + retry
+        assert mcp_route.call_count == 1
+        assert adapter._initialize_result is None
+
+    async def test_no_retry_if_already_initialized(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            # Pre-initialize the adapter
+            _init_response(),
+            httpx.Response(202),
+            # Now a request fails — should NOT retry since already initialized
+            httpx.Response(400, text="Bad Request"),
+        ]
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.on_fail, client=shared_async_client
         )
+        await adapter.initialize()
 
-        adapter = BaseAdapter(base_url, init_mode=InitMode.on_fail)
+        with pytest.raises(httpx.HTTPStatusError):
+            await adapter.get_mcp_tools()
+
+        assert mcp_route.call_count == 3
+
+    async def test_error_propagates_if_retry_also_fails(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            # First tools/list fails
+            httpx.Response(400, text="Bad Request"),
+            # initialize succeeds
+            _init_response(),
+            # notifications/initialized
+            httpx.Response(202),
+            # Retry tools/list also fails
+            httpx.Response(500, text="Internal Server Error"),
+        ]
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.on_fail, client=shared_async_client
+        )
 
         with pytest.raises(httpx.HTTPStatusError) as exc_info:
             await adapter.get_mcp_tools()
 
         assert exc_info.value.response.status_code == 500
-        assert route.call_count == 4
+        assert mcp_route.call_count == 4
+
+    async def test_concurrent_failures_share_one_handshake(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        # The server answers the batch with a single error, so the calls fall
+        # back to concurrent individual requests that each need a session.
+        init_requests = 0
+
+        async def reply(request: httpx.Request) -> httpx.Response:
+            nonlocal init_requests
+            body = json.loads(request.content)
+            if isinstance(body, list):
+                return httpx.Response(
+                    200, json={"jsonrpc": "2.0", "id": None, "error": {}}
+                )
+            if body["method"] == "initialize":
+                init_requests += 1
+                # Let the other failed calls reach initialize() meanwhile.
+                await asyncio.sleep(0.01)
+                return _init_response()
+            if body["method"] == "notifications/initialized":
+                return httpx.Response(202)
+            if "Mcp-Session-Id" not in request.headers:
+                return httpx.Response(400, text="Missing session")
+            return _json_response(CALL_RESULT_BYTES)
+
+        mcp_route.side_effect = reply
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.on_fail, client=shared_async_client
+        )
+        results = await adapter.call_mcp_tools_batch([("t", {})] * 5)
+
+        assert [r["result"] for r in results] == [CALL_RESULT["result"]] * 5
+        assert init_requests == 1
 
 
 class TestInitModeNone:
-    @respx.mock
-    async def test_does_not_call_initialize(self, base_url):
-        tools_result = {
-            "jsonrpc": "2.0",
-            "id": "2",
-            "result": {"tools": []},
-        }
-        route = respx.post(base_url).mock(
-            return_value=httpx.Response(200, json=tools_result),
-        )
+    async def test_does_not_call_initialize(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = _json_response(TOOLS_RESULT_BYTES)
 
-        adapter = BaseAdapter(base_url, init_mode=InitMode.none)
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
         result = await adapter.get_mcp_tools()
 
-        assert result == tools_result
+        assert result == TOOLS_RESULT
         # Only 1 call: tools/list, no init
-        assert route.call_count == 1
+        assert mcp_route.call_count == 1
 
-    @respx.mock
-    async def test_error_propagates_directly(self, base_url):
-        route = respx.post(base_url).mock(
-            return_value=httpx.Response(400, text="Bad Request"),
-        )
+    async def test_error_propagates_directly(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(400, text="Bad Request")
 
-        adapter = BaseAdapter(base_url, init_mode=InitMode.none)
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
 
         with pytest.raises(httpx.HTTPStatusError):
             await adapter.get_mcp_tools()
 
         # Only 1 call, no retry, no init
-        assert route.call_count == 1
+        assert mcp_route.call_count == 1
 
 
 class TestParseSSE:
@@ -537,7 +565,7 @@ class TestParseSSE:
         sse_body = _sse_body(payload)
         response = httpx.Response(
             200,
-            text=sse_body,
+            content=sse_body,
             headers={"content-type": "text/event-stream"},
         )
         assert BaseAdapter._parse_response(response) == payload
@@ -553,25 +581,63 @@ class TestParseSSE:
         assert BaseAdapter._parse_response(response) == payload
 
     def test_parses_sse_with_charset(self):
-        payload = {"jsonrpc": "2.0", "id": "1", "result": {}}
-        sse_body = _sse_body(payload)
         response = httpx.Response(
             200,
-            text=sse_body,
+            content=SSE_EMPTY_RESULT,
             headers={"content-type": "text/event-stream; charset=utf-8"},
         )
-        assert BaseAdapter._parse_response(response) == payload
+        assert BaseAdapter._parse_response(response) == EMPTY_RESULT
 
     def test_sse_returns_last_event(self):
-        first = {"jsonrpc": "2.0", "method": "notifications/progress"}
-        second = {"jsonrpc": "2.0", "id": "1", "result": {"done": True}}
-        sse_body = _sse_body(first) + _sse_body(second)
+        response = httpx.Response(
+            200,
+            content=SSE_PROGRESS + SSE_DONE_RESULT,
+            headers={"content-type": "text/event-stream"},
+        )
+        assert BaseAdapter._parse_response(response) == DONE_RESULT
+
+    def test_sse_skips_trailing_event_without_data(self):
+        response = httpx.Response(
+            200,
+            content=SSE_DONE_RESULT + b": keep-alive\n\n\n",
+            headers={"content-type": "text/event-stream"},
+        )
+        assert BaseAdapter._parse_response(response) == DONE_RESULT
+
+    def test_sse_does_not_decode_earlier_events(self):
+        response = httpx.Response(
+            200,
+            content=b"data: {not json\n\n" + SSE_DONE_RESULT,
+            headers={"content-type": "text/event-stream"},
+        )
+        assert BaseAdapter._parse_response(response) == DONE_RESULT
+
+    def test_sse_with_crlf_line_endings(self):
+        sse_body = (SSE_PROGRESS + SSE_EMPTY_RESULT).replace(b"\n", b"\r\n")
+        response = httpx.Response(
+            200,
+            content=sse_body,
+            headers={"content-type": "text/event-stream"},
+        )
+        assert BaseAdapter._parse_response(response) == EMPTY_RESULT
+
+    def test_sse_joins_multiline_data(self):
+        sse_body = ': comment\ndata:{"jsonrpc": "2.0",\ndata: "id": "1"}\n\n'
         response = httpx.Response(
             200,
             text=sse_body,
             headers={"content-type": "text/event-stream"},
         )
-        assert BaseAdapter._parse_response(response) == second
+        assert BaseAdapter._parse_response(response) == {"jsonrpc": "2.0", "id": "1"}
+
+    def test_sse_non_ascii_utf8(self):
+        payload = {"jsonrpc": "2.0", "id": "1", "result": {"text": "héllo → 世界"}}
+        response = httpx.Response(
+            200,
+            content=f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+        assert BaseAdapter._parse_response(response) == payload
 
     def test_sse_raises_on_empty_body(self):
         response = httpx.Response(
@@ -579,63 +645,511 @@ class TestParseSSE:
             text="",
             headers={"content-type": "text/event-stream"},
         )
-        with pytest.raises(ValueError, match="No data field found"):
+        with pytest.raises(ValueError) as exc_info:
             BaseAdapter._parse_response(response)
+        assert str(exc_info.value) == "No data field found in SSE response"
 
 
 class TestInitializeSSE:
-    @respx.mock
-    async def test_initialize_parses_sse_response(self, base_url):
-        init_result = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {
-                "protocolVersion": PROTOCOL_VERSION,
-                "capabilities": {},
-                "serverInfo": {"name": "test-server", "version": "1.0"},
-            },
-        }
-        sse_body = _sse_body(init_result)
-        respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(
-                    200,
-                    text=sse_body,
-                    headers={
-                        "content-type": "text/event-stream",
-                        "Mcp-Session-Id": "sess-sse-1",
-                    },
-                ),
-                httpx.Response(202),
-            ]
-        )
+    async def test_initialize_parses_sse_response(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            httpx.Response(
+                200,
+                content=SSE_INIT_FULL,
+                headers={
+                    "content-type": "text/event-stream",
+                    "Mcp-Session-Id": "sess-sse-1",
+                },
+            ),
+            httpx.Response(202),
+        ]
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         result = await adapter.initialize()
 
-        assert result == init_result
+        assert result == INIT_RESULT_FULL
         assert adapter._session_id == "sess-sse-1"
         assert adapter._protocol_version == PROTOCOL_VERSION
 
-    @respx.mock
-    async def test_make_request_parses_sse_response(self, base_url):
+    async def test_make_request_parses_sse_response(
+        self, base_url, shared_async_client, mcp_route
+    ):
         tools_result = {
             "jsonrpc": "2.0",
             "id": "2",
             "result": {"tools": [{"name": "my_tool"}]},
         }
         sse_body = _sse_body(tools_result)
-        respx.post(base_url).mock(
-            return_value=httpx.Response(
-                200,
-                text=sse_body,
-                headers={"content-type": "text/event-stream"},
-            ),
+        mcp_route.return_value = httpx.Response(
+            200,
+            content=sse_body,
+            headers={"content-type": "text/event-stream"},
         )
 
-        adapter = BaseAdapter(base_url)
+        adapter = BaseAdapter(base_url, client=shared_async_client)
         result = await adapter._make_request(
             {"id": "2", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
         )
 
         assert result == tools_result
+
+
+class TestClientLifecycle:
+    async def test_reuses_client_across_requests(self, base_url, mcp_route):
+        mcp_route.return_value = _json_response(EMPTY_RESULT_BYTES)
+
+        adapter = BaseAdapter(base_url, init_mode=InitMode.none)
+        await adapter.get_mcp_tools()
+        client = adapter._client
+        await adapter.call_mcp_tool("test_tool", {})
+
+        assert client is not None
+        assert adapter._client is client
+
+    async def test_client_has_no_bound_session_headers(self, base_url, mcp_route):
+        mcp_route.side_effect = [
+            _init_response(),
+            httpx.Response(202),
+        ]
+
+        adapter = BaseAdapter(base_url)
+        await adapter.initialize()
+
+        assert "Mcp-Session-Id" not in adapter._client.headers
+
+    async def test_aclose_closes_client(self, base_url):
+        adapter = BaseAdapter(base_url)
+        client = adapter._get_client()
+
+        await adapter.aclose()
+
+        assert client.is_closed
+        assert adapter._client is None
+
+    async def test_async_context_manager_closes_client(self, base_url):
+        async with BaseAdapter(base_url) as adapter:
+            client = adapter._get_client()
+
+        assert client.is_closed
+        assert adapter._client is None
+
+    async def test_injected_client_is_used(self, base_url, shared_async_client):
+        adapter = BaseAdapter(base_url, client=shared_async_client)
+        assert adapter._get_client() is shared_async_client
+
+    async def test_aclose_leaves_injected_client_open(self, base_url):
+        async with httpx.AsyncClient() as client:
+            async with BaseAdapter(base_url, client=client) as adapter:
+                pass
+
+            assert not client.is_closed
+            assert adapter._client is client
+
+
+class TestHTTP2:
+    def test_http2_disabled_by_default(self, base_url):
+        adapter = BaseAdapter(base_url)
+        assert adapter.http2 is False
+
+    def test_http2_requires_h2(self, base_url, monkeypatch):
+        monkeypatch.setitem(sys.modules, "h2", None)
+        with pytest.raises(ImportError) as exc_info:
+            BaseAdapter(base_url, http2=True)
+        assert str(exc_info.value) == INSTALL_HTTP2
+
+
+class TestCallMCPToolsBatch:
+    async def test_sends_single_batch_request(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        def reply(request):
+            payload = _json.loads(request.content)
+            # Answer out of order; results must still follow input order
+            return httpx.Response(
+                200,
+                json=[
+                    {"jsonrpc": "2.0", "id": msg["id"], "result": msg["params"]["name"]}
+                    for msg in reversed(payload)
+                ],
+            )
+
+        mcp_route.side_effect = reply
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        results = await adapter.call_mcp_tools_batch(
+            [("first", {"a": 1}), ("second", {"b": 2})]
+        )
+
+        assert mcp_route.call_count == 1
+        payload = _json.loads(mcp_route.calls[0].request.content)
+        assert [msg["method"] for msg in payload] == ["tools/call", "tools/call"]
+        assert payload[0]["params"] == {"name": "first", "arguments": {"a": 1}}
+        assert [r["result"] for r in results] == ["first", "second"]
+        assert adapter._batch_supported is True
+
+    async def test_single_call_is_not_batched(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = _json_response(EMPTY_RESULT_BYTES)
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        await adapter.call_mcp_tools_batch([("only", {})])
+
+        payload = _json.loads(mcp_route.calls[0].request.content)
+        assert payload["method"] == "tools/call"
+
+    @pytest.mark.parametrize(
+        "rejection",
+        [
+            httpx.Response(400, text="Batch not supported"),
+            httpx.Response(422, text="Unprocessable"),
+            httpx.Response(500, text="Internal Server Error"),
+            # accepted but never answered, as for a notification
+            httpx.Response(202),
+        ],
+        ids=["400", "422", "500", "empty-202"],
+    )
+    async def test_falls_back_to_individual_calls_on_rejection(
+        self, base_url, shared_async_client, mcp_route, rejection
+    ):
+        mcp_route.side_effect = [
+            rejection,
+            httpx.Response(200, json={"jsonrpc": "2.0", "id": "1", "result": 1}),
+            httpx.Response(200, json={"jsonrpc": "2.0", "id": "2", "result": 2}),
+            httpx.Response(200, json={"jsonrpc": "2.0", "id": "3", "result": 3}),
+            httpx.Response(200, json={"jsonrpc": "2.0", "id": "4", "result": 4}),
+        ]
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        results = await adapter.call_mcp_tools_batch([("a", {}), ("b", {})])
+
+        assert [r["result"] for r in results] == [1, 2]
+        assert adapter._batch_supported is False
+
+        # Batching is not attempted again
+        results = await adapter.call_mcp_tools_batch([("a", {}), ("b", {})])
+        assert [r["result"] for r in results] == [3, 4]
+        assert mcp_route.call_count == 5
+
+    async def test_falls_back_on_non_batch_reply(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        invalid = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600}}
+        mcp_route.side_effect = [
+            httpx.Response(200, json=invalid),
+            httpx.Response(200, json={"jsonrpc": "2.0", "id": "1", "result": 1}),
+            httpx.Response(200, json={"jsonrpc": "2.0", "id": "2", "result": 2}),
+        ]
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        results = await adapter.call_mcp_tools_batch([("a", {}), ("b", {})])
+
+        assert [r["result"] for r in results] == [1, 2]
+        assert adapter._batch_supported is False
+
+    async def test_missing_response_returned_as_exception(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        def reply(request):
+            first = _json.loads(request.content)[0]
+            return httpx.Response(
+                200, json=[{"jsonrpc": "2.0", "id": first["id"], "result": 1}]
+            )
+
+        mcp_route.side_effect = reply
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        results = await adapter.call_mcp_tools_batch(
+            [("a", {}), ("b", {})], return_exceptions=True
+        )
+
+        assert results[0]["result"] == 1
+        assert isinstance(results[1], MCPHeroException)
+
+    async def test_http_error_raises_without_return_exceptions(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(500, text="Internal Server Error")
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await adapter.call_mcp_tools_batch([("a", {}), ("b", {})])
+
+    @pytest.mark.parametrize(
+        ("max_concurrency", "n_calls", "expected"),
+        [
+            # the default limit (10) lets every call run at once
+            (None, 4, 4),
+            (2, 6, 2),
+        ],
+        ids=["default", "limited"],
+    )
+    async def test_individual_fallback_concurrency(
+        self,
+        base_url,
+        shared_async_client,
+        mcp_route,
+        in_flight_reply,
+        max_concurrency,
+        n_calls,
+        expected,
+    ):
+        mcp_route.side_effect = in_flight_reply
+
+        kwargs = {} if max_concurrency is None else {"max_concurrency": max_concurrency}
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client, **kwargs
+        )
+        results = await adapter.call_mcp_tools_batch(
+            [("t", {"n": n}) for n in range(n_calls)]
+        )
+
+        assert len(results) == n_calls
+        assert in_flight_reply.max_in_flight == expected
+
+
+class TestToolsCache:
+    async def test_second_call_uses_cache(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        tools_result = {"jsonrpc": "2.0", "id": "1", "result": {"tools": []}}
+        mcp_route.return_value = httpx.Response(200, json=tools_result)
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        first = await adapter.get_mcp_tools()
+        second = await adapter.get_mcp_tools()
+
+        assert first == second == tools_result
+        assert mcp_route.call_count == 1
+
+    async def test_invalidate_refetches(self, base_url, shared_async_client, mcp_route):
+        mcp_route.return_value = httpx.Response(
+            200, json={"jsonrpc": "2.0", "id": "1", "result": {"tools": []}}
+        )
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        await adapter.get_mcp_tools()
+        adapter.invalidate_tools_cache()
+        await adapter.get_mcp_tools()
+
+        assert mcp_route.call_count == 2
+
+    async def test_expired_ttl_refetches(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(
+            200, json={"jsonrpc": "2.0", "id": "1", "result": {"tools": []}}
+        )
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, tools_ttl=0, client=shared_async_client
+        )
+        await adapter.get_mcp_tools()
+        await adapter.get_mcp_tools()
+
+        assert mcp_route.call_count == 2
+
+    async def test_error_response_not_cached(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        error = {
+            "jsonrpc": "2.0",
+            "id": "1",
+            "error": {"code": -32603, "message": "boom"},
+        }
+        mcp_route.return_value = httpx.Response(200, json=error)
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        await adapter.get_mcp_tools()
+        await adapter.get_mcp_tools()
+
+        assert mcp_route.call_count == 2
+
+
+class TestStreamingSSE:
+    async def test_parses_events_split_across_chunks(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        body = (SSE_PROGRESS + SSE_DONE_RESULT).replace(b"\n", b"\r\n")
+
+        async def chunks():
+            for i in range(0, len(body), 7):
+                yield body[i : i + 7]
+
+        mcp_route.return_value = httpx.Response(
+            200,
+            content=chunks(),
+            headers={"content-type": "text/event-stream"},
+        )
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        result = await adapter._make_request(
+            {"id": "1", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
+        )
+
+        assert result == DONE_RESULT
+
+    async def test_multiline_data_without_trailing_newline(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(
+            200,
+            text='data: {"jsonrpc": "2.0",\ndata: "id": "1", "result": {}}',
+            headers={"content-type": "text/event-stream"},
+        )
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        result = await adapter._make_request(
+            {"id": "1", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
+        )
+
+        assert result == {"jsonrpc": "2.0", "id": "1", "result": {}}
+
+    async def test_raises_on_stream_without_data(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(
+            200,
+            text=": keep-alive\n\n",
+            headers={"content-type": "text/event-stream"},
+        )
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        with pytest.raises(ValueError) as exc_info:
+            await adapter._make_request(
+                {"id": "1", "jsonrpc": "2.0", "method": "tools/list", "params": {}}
+            )
+        assert str(exc_info.value) == "No data field found in SSE response"
+
+
+class TestRequestIds:
+    async def test_ids_are_sequential_integers(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(
+            200, json={"jsonrpc": "2.0", "id": 1, "result": {"tools": []}}
+        )
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        await adapter.get_mcp_tools()
+        await adapter.call_mcp_tool("test_tool", {})
+
+        ids = [_json.loads(call.request.content)["id"] for call in mcp_route.calls]
+        assert ids == [1, 2]
+
+    async def test_tools_list_body(self, base_url, shared_async_client, mcp_route):
+        mcp_route.return_value = httpx.Response(
+            200, json={"jsonrpc": "2.0", "id": 1, "result": {"tools": []}}
+        )
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        await adapter.get_mcp_tools()
+
+        assert _json.loads(mcp_route.calls.last.request.content) == {
+            "jsonrpc": "2.0",
+            "method": "tools/list",
+            "params": {},
+            "id": 1,
+        }
+        assert (
+            mcp_route.calls.last.request.headers["Content-Type"] == "application/json"
+        )
+
+    async def test_tools_call_body(self, base_url, shared_async_client, mcp_route):
+        mcp_route.return_value = httpx.Response(
+            200, json={"jsonrpc": "2.0", "id": 1, "result": {}}
+        )
+
+        adapter = BaseAdapter(
+            base_url, init_mode=InitMode.none, client=shared_async_client
+        )
+        await adapter.call_mcp_tool('say "hi"', {"text": "ünïcode", "n": [1, None]})
+        await adapter.call_mcp_tool('say "hi"', {})
+
+        bodies = [_json.loads(call.request.content) for call in mcp_route.calls]
+        assert bodies == [
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {
+                    "name": 'say "hi"',
+                    "arguments": {"text": "ünïcode", "n": [1, None]},
+                },
+                "id": 1,
+            },
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {"name": 'say "hi"', "arguments": {}},
+                "id": 2,
+            },
+        ]
+
+
+class TestRequestHeaders:
+    def test_headers_reused_between_requests(self, base_url):
+        adapter = BaseAdapter(base_url, headers={"Authorization": "Bearer t"})
+
+        headers = adapter._request_headers()
+
+        assert headers["Authorization"] == "Bearer t"
+        assert adapter._request_headers() is headers
+
+    def test_mutated_headers_are_sent(self, base_url):
+        adapter = BaseAdapter(base_url, headers={"Authorization": "Bearer old"})
+        adapter._request_headers()
+
+        adapter.headers["Authorization"] = "Bearer new"
+        assert adapter._request_headers()["Authorization"] == "Bearer new"
+
+        adapter.headers = {"X-Api-Key": "k"}
+        headers = adapter._request_headers()
+        assert headers["X-Api-Key"] == "k"
+        assert "Authorization" not in headers
+
+    async def test_headers_rebuilt_after_initialize(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        mcp_route.side_effect = [
+            _init_response(),
+            httpx.Response(202),
+        ]
+
+        adapter = BaseAdapter(base_url, client=shared_async_client)
+        before = adapter._request_headers()
+        await adapter.initialize()
+        after = adapter._request_headers()
+
+        assert "Mcp-Session-Id" not in before
+        assert after["Mcp-Session-Id"] == "s1"
+        assert after["MCP-Protocol-Version"] == PROTOCOL_VERSION
@@ -0,0 +1,81 @@
+import httpx
+import pytest
+
+from mcphero.adapters.base_adapter import BaseAdapter, InitMode
+
+
+class TestBaseAdapterInit:
+    def test_stores_base_url(self, base_url):
+        adapter = BaseAdapter(base_url)
+        assert adapter.base_url == base_url
+
+    def test_strips_trailing_slash(self):
+        adapter = BaseAdapter("https://example.com/")
+        assert adapter.base_url == "https://example.com"
+
+    def test_parses_url_once(self, base_url):
+        adapter = BaseAdapter(base_url)
+        assert adapter._url == httpx.URL(base_url)
+
+    def test_invalid_url_raises(self):
+        with pytest.raises(httpx.InvalidURL):
+            BaseAdapter("http://[::1")
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [({}, 30.0), ({"timeout": 60.0}, 60.0)],
+        ids=["default", "custom"],
+    )
+    def test_timeout(self, base_url, kwargs, expected):
+        adapter = BaseAdapter(base_url, **kwargs)
+        assert adapter.timeout == expected
+
+    def test_default_max_concurrency(self, base_url):
+        adapter = BaseAdapter(base_url)
+        assert adapter.max_concurrency == 10
+
+    def test_invalid_max_concurrency_raises(self, base_url):
+        with pytest.raises(ValueError):
+            BaseAdapter(base_url, max_concurrency=0)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, {}),
+            (
+                {"headers": {"Authorization": "Bearer token"}},
+                {"Authorization": "Bearer token"},
+            ),
+        ],
+        ids=["default", "custom"],
+    )
+    def test_headers(self, base_url, kwargs, expected):
+        adapter = BaseAdapter(base_url, **kwargs)
+        assert adapter.headers == expected
+
+    def test_invalid_init_mode_raises(self, base_url):
+        with pytest.raises(ValueError):
+            BaseAdapter(base_url, init_mode="sometimes")
+
+    def test_strict_init_by_default(self, base_url):
+        adapter = BaseAdapter(base_url)
+        assert adapter.strict_init is True
+
+    def test_initial_session_state(self, base_url):
+        adapter = BaseAdapter(base_url)
+        assert adapter._session_id is None
+        assert adapter._initialize_result is None
+        assert adapter._protocol_version is None
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, InitMode.auto),
+            ({"init_mode": "on_fail"}, InitMode.on_fail),
+            ({"init_mode": InitMode.none}, InitMode.none),
+        ],
+        ids=["default-auto", "string", "enum"],
+    )
+    def test_init_mode(self, base_url, kwargs, expected):
+        adapter = BaseAdapter(base_url, **kwargs)
+        assert adapter.init_mode == expected
@@ -1,6 +1,5 @@
 import httpx
 import pytest
-import respx
 
 try:
     from google.genai import types
@@ -14,21 +13,19 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
-def adapter(base_url):
+@pytest.fixture(scope="session")
+def adapter(base_url, shared_async_client):
+    """One adapter for the whole session; the mock server needs no handshake."""
     from mcphero.adapters.gemini import MCPToolAdapterGemini
 
-    return MCPToolAdapterGemini(base_url)
+    return MCPToolAdapterGemini(base_url, init_mode="none", client=shared_async_client)
 
 
 class TestGetFunctionDeclarations:
-    @respx.mock
-    async def test_converts_mcp_tools(self, base_url, adapter, sample_mcp_tools):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(
-                200, json={"result": {"tools": sample_mcp_tools}}
-            )
-        )
+    async def test_converts_mcp_tools(
+        self, adapter, sample_tools_list_bytes, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(200, content=sample_tools_list_bytes)
 
         declarations = await adapter.get_function_declarations()
 
@@ -36,14 +33,11 @@ class TestGetFunctionDeclarations:
         assert declarations[0].name == "get_weather"
         assert declarations[0].description == "Get the current weather for a location"
 
-    @respx.mock
     async def test_handles_missing_schema(
-        self, base_url, adapter, sample_mcp_tool_no_schema
+        self, adapter, sample_tools_list_no_schema_bytes, mcp_route
     ):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(
-                200, json={"result": {"tools": sample_mcp_tool_no_schema}}
-            )
+        mcp_route.return_value = httpx.Response(
+            200, content=sample_tools_list_no_schema_bytes
         )
 
         declarations = await adapter.get_function_declarations()
@@ -51,26 +45,29 @@ class TestGetFunctionDeclarations:
         assert len(declarations) == 1
         assert declarations[0].name == "ping"
 
-    @respx.mock
-    async def test_empty_list(self, base_url, adapter):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json={"result": {"tools": []}})
-        )
+    async def test_empty_list(self, adapter, mcp_route):
+        mcp_route.return_value = httpx.Response(200, json={"result": {"tools": []}})
 
         declarations = await adapter.get_function_declarations()
         assert declarations == []
 
+    async def test_conversion_is_cached(
+        self, adapter, sample_tools_list_bytes, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(200, content=sample_tools_list_bytes)
+
+        first = await adapter.get_function_declarations()
+        second = await adapter.get_function_declarations()
+
+        assert first == second
+        assert first[0] is second[0]
+
 
 class TestGetTool:
-    @respx.mock
     async def test_returns_tool_wrapping_declarations(
-        self, base_url, adapter, sample_mcp_tools
+        self, adapter, sample_tools_list_bytes, mcp_route
     ):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(
-                200, json={"result": {"tools": sample_mcp_tools}}
-            )
-        )
+        mcp_route.return_value = httpx.Response(200, content=sample_tools_list_bytes)
 
         tool = await adapter.get_tool()
 
@@ -79,11 +76,17 @@ class TestGetTool:
 
 
 class TestProcessFunctionCalls:
-    @respx.mock
-    async def test_success(self, base_url, adapter, sample_tool_result):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json=sample_tool_result)
-        )
+    @pytest.mark.parametrize(
+        ("body", "response"),
+        [
+            (b'{"temp": 72}', {"temp": 72}),
+            # non-dict results get wrapped as {"result": ...}
+            (b'"string result"', {"result": "string result"}),
+        ],
+        ids=["dict", "non-dict"],
+    )
+    async def test_success(self, adapter, mcp_route, body, response):
+        mcp_route.return_value = httpx.Response(200, content=body)
 
         fc = types.FunctionCall(name="get_weather", args={"location": "London"})
         results = await adapter.process_function_calls([fc])
@@ -92,58 +95,72 @@ class TestProcessFunctionCalls:
         assert isinstance(results[0], types.Content)
         assert results[0].role == "user"
         assert len(results[0].parts) == 1
+        assert results[0].parts[0].function_response.response == response
 
-    @respx.mock
-    async def test_non_dict_result_wrapped(self, base_url, adapter):
-        # When result is not a dict, it gets wrapped as {"result": ...}
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json="string result")
-        )
+    async def test_multiple_calls(self, adapter, mcp_route, echo_reply):
+        mcp_route.side_effect = echo_reply
 
-        fc = types.FunctionCall(name="get_weather", args={"location": "London"})
-        results = await adapter.process_function_calls([fc])
+        fcs = [
+            types.FunctionCall(name="get_weather", args={"location": "London"}),
+            types.FunctionCall(name="search", args={"query": "test"}),
+        ]
+        results = await adapter.process_function_calls(fcs)
 
-        assert len(results) == 1
+        assert len(results) == 2
+        assert results[0].parts[0].function_response.name == "get_weather"
+        assert results[1].parts[0].function_response.name == "search"
+        # one batched tools/call request
+        assert mcp_route.call_count == 1
 
-    @respx.mock
-    async def test_dict_result_passed_directly(self, base_url, adapter):
-        data = {"temp": 72}
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json=data)
-        )
+    async def test_batch_fallback_keeps_call_order(
+        self, adapter, mcp_route, batch_rejecting_reply
+    ):
+        mcp_route.side_effect = batch_rejecting_reply
 
-        fc = types.FunctionCall(name="get_weather", args={"location": "London"})
-        results = await adapter.process_function_calls([fc])
+        fcs = [types.FunctionCall(name=f"tool_{n}", args={}) for n in range(4)]
+        results = await adapter.process_function_calls(fcs)
 
-        assert len(results) == 1
+        responses = [r.parts[0].function_response for r in results]
+        assert [r.name for r in responses] == [f"tool_{n}" for n in range(4)]
+        assert [r.response["result"] for r in responses] == [
+            f"tool_{n}" for n in range(4)
+        ]
+        # rejected batch, then one request per call
+        assert mcp_route.call_count == 5
 
-    @respx.mock
-    async def test_http_error(self, base_url, adapter):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(500, text="Server Error")
-        )
+    @pytest.mark.parametrize(("return_errors", "count"), [(True, 1), (False, 0)])
+    async def test_http_error(self, adapter, mcp_route, return_errors, count):
+        mcp_route.return_value = httpx.Response(500, text="Server Error")
 
         fc = types.FunctionCall(name="get_weather", args={"location": "London"})
-        results = await adapter.process_function_calls([fc])
+        results = await adapter.process_function_calls(
+            [fc], return_errors=return_errors
+        )
 
-        assert len(results) == 1
+        assert len(results) == count
 
-    @respx.mock
-    async def test_return_errors_false(self, base_url, adapter):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(500, text="Server Error")
-        )
+    async def test_failed_initialize_returns_error_per_call(
+        self, base_url, shared_async_client, mcp_route
+    ):
+        from mcphero.adapters.gemini import MCPToolAdapterGemini
 
-        fc = types.FunctionCall(name="get_weather", args={"location": "London"})
-        results = await adapter.process_function_calls([fc], return_errors=False)
+        mcp_route.return_value = httpx.Response(500, text="Server Error")
 
-        assert len(results) == 0
+        fresh = MCPToolAdapterGemini(base_url, client=shared_async_client)
+        fcs = [
+            types.FunctionCall(name="get_weather", args={"location": "London"}),
+            types.FunctionCall(name="search", args={"query": "test"}),
+        ]
+        results = await fresh.process_function_calls(fcs)
 
-    @respx.mock
-    async def test_empty_args(self, base_url, adapter):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json={"status": "ok"})
-        )
+        names = [r.parts[0].function_response.name for r in results]
+        assert names == ["get_weather", "search"]
+        for result in results:
+            response = result.parts[0].function_response.response
+            assert "HTTP error" in response["error"]
+
+    async def test_empty_args(self, adapter, mcp_route):
+        mcp_route.return_value = httpx.Response(200, json={"status": "ok"})
 
         fc = types.FunctionCall(name="ping", args=None)
         results = await adapter.process_function_calls([fc])
@@ -152,11 +169,8 @@ class TestProcessFunctionCalls:
 
 
 class TestProcessFunctionCallsAsParts:
-    @respx.mock
-    async def test_returns_parts(self, base_url, adapter, sample_tool_result):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json=sample_tool_result)
-        )
+    async def test_returns_parts(self, adapter, sample_tool_result_bytes, mcp_route):
+        mcp_route.return_value = httpx.Response(200, content=sample_tool_result_bytes)
 
         fc = types.FunctionCall(name="get_weather", args={"location": "London"})
         parts = await adapter.process_function_calls_as_parts([fc])
@@ -164,17 +178,24 @@ class TestProcessFunctionCallsAsParts:
         assert len(parts) == 1
         assert isinstance(parts[0], types.Part)
 
-    @respx.mock
-    async def test_error_returns_part(self, base_url, adapter):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(500, text="Server Error")
-        )
+    async def test_error_returns_part(self, adapter, mcp_route):
+        mcp_route.return_value = httpx.Response(500, text="Server Error")
 
         fc = types.FunctionCall(name="get_weather", args={"location": "London"})
         parts = await adapter.process_function_calls_as_parts([fc])
 
         assert len(parts) == 1
         assert isinstance(parts[0], types.Part)
+        assert parts[0].function_response.name == "get_weather"
+        assert "HTTP error" in parts[0].function_response.response["error"]
+
+    async def test_return_errors_false_omits_failures(self, adapter, mcp_route):
+        mcp_route.return_value = httpx.Response(500, text="Server Error")
+
+        fc = types.FunctionCall(name="get_weather", args={"location": "London"})
+        parts = await adapter.process_function_calls_as_parts([fc], return_errors=False)
+
+        assert parts == []
 
 
 class TestCreateFunctionResponseContent:
@@ -0,0 +1,36 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+from mcphero import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_module(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    yield importlib.reload(_json)
+    monkeypatch.undo()
+    importlib.reload(_json)
+
+
+class TestJSON:
+    def test_dumps_returns_str(self, json_module):
+        assert json.loads(json_module.dumps({"a": [1, "b"]})) == {"a": [1, "b"]}
+
+    def test_dumps_bytes_returns_bytes(self, json_module):
+        encoded = json_module.dumps_bytes({"a": [1, "b"]})
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == {"a": [1, "b"]}
+
+    def test_loads_accepts_str_and_bytes(self, json_module):
+        assert json_module.loads('{"a": 1}') == {"a": 1}
+        assert json_module.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_invalid_input_raises_json_decode_error(self, json_module):
+        with pytest.raises(json.JSONDecodeError):
+            json_module.loads("not valid json{{{")
@@ -2,45 +2,42 @@ import json
 
 import httpx
 import pytest
-import respx
-from openai.types.chat import ChatCompletionMessageToolCall
-from openai.types.chat.chat_completion_message_tool_call import Function
 
+from mcphero import _json
 from mcphero.adapters.openai import MCPToolAdapterOpenAI
 
 
+@pytest.fixture(scope="session")
+def openai_adapter(base_url, shared_async_client):
+    """One adapter for the whole session; the mock server needs no handshake."""
+    return MCPToolAdapterOpenAI(base_url, init_mode="none", client=shared_async_client)
+
+
 class TestGetToolDefinitions:
-    @respx.mock
     async def test_converts_mcp_tools_to_openai_format(
-        self, base_url, sample_mcp_tools
+        self, openai_adapter, sample_mcp_tools, sample_tools_list_bytes, mcp_route
     ):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(
-                200, json={"result": {"tools": sample_mcp_tools}}
-            )
-        )
+        mcp_route.return_value = httpx.Response(200, content=sample_tools_list_bytes)
 
-        adapter = MCPToolAdapterOpenAI(base_url)
-        tools = await adapter.get_tool_definitions()
+        tools = await openai_adapter.get_tool_definitions()
 
         assert len(tools) == 2
         assert tools[0]["type"] == "function"
         assert tools[0]["function"]["name"] == "get_weather"
-        assert tools[0]["function"]["description"] == "Get the current weather for a location"
+        assert (
+            tools[0]["function"]["description"]
+            == "Get the current weather for a location"
+        )
         assert tools[0]["function"]["parameters"] == sample_mcp_tools[0]["inputSchema"]
 
-    @respx.mock
     async def test_handles_missing_input_schema(
-        self, base_url, sample_mcp_tool_no_schema
+        self, openai_adapter, sample_tools_list_no_schema_bytes, mcp_route
     ):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(
-                200, json={"result": {"tools": sample_mcp_tool_no_schema}}
-            )
+        mcp_route.return_value = httpx.Response(
+            200, content=sample_tools_list_no_schema_bytes
         )
 
-        adapter = MCPToolAdapterOpenAI(base_url)
-        tools = await adapter.get_tool_definitions()
+        tools = await openai_adapter.get_tool_definitions()
 
         assert len(tools) == 1
         assert tools[0]["function"]["parameters"] == {
@@ -48,181 +45,127 @@ class TestGetToolDefinitions:
             "properties": {},
         }
 
-    @respx.mock
-    async def test_handles_empty_tools(self, base_url):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json={"result": {"tools": []}})
-        )
+    async def test_handles_empty_tools(self, openai_adapter, mcp_route):
+        mcp_route.return_value = httpx.Response(200, json={"result": {"tools": []}})
 
-        adapter = MCPToolAdapterOpenAI(base_url)
-        tools = await adapter.get_tool_definitions()
+        tools = await openai_adapter.get_tool_definitions()
         assert tools == []
 
+    async def test_conversion_is_cached(
+        self, openai_adapter, sample_tools_list_bytes, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(200, content=sample_tools_list_bytes)
+
+        first = await openai_adapter.get_tool_definitions()
+        second = await openai_adapter.get_tool_definitions()
+
+        assert first == second
+        assert first is not second
+        assert mcp_route.call_count == 1
+
 
 class TestProcessToolCalls:
-    @respx.mock
-    async def test_success(self, base_url, sample_tool_result):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json=sample_tool_result)
-        )
+    @pytest.mark.parametrize(
+        ("body", "content"),
+        [
+            # dict results are JSON-encoded
+            (b'{"temp": 72}', _json.dumps({"temp": 72})),
+            # string results are passed through directly, not JSON-encoded again
+            (b'"plain string result"', "plain string result"),
+        ],
+        ids=["dict", "string"],
+    )
+    async def test_success(
+        self, openai_adapter, tool_call_factory, mcp_route, body, content
+    ):
+        mcp_route.return_value = httpx.Response(200, content=body)
 
-        adapter = MCPToolAdapterOpenAI(base_url)
         tool_calls = [
-            ChatCompletionMessageToolCall(
-                id="call_1",
-                type="function",
-                function=Function(
-                    name="get_weather",
-                    arguments=json.dumps({"location": "London"}),
-                ),
-            )
+            tool_call_factory("call_1", "get_weather", {"location": "London"})
         ]
 
-        results = await adapter.process_tool_calls(tool_calls)
+        results = await openai_adapter.process_tool_calls(tool_calls)
 
         assert len(results) == 1
         assert results[0]["role"] == "tool"
         assert results[0]["tool_call_id"] == "call_1"
-        assert json.loads(results[0]["content"]) == sample_tool_result
-
-    @respx.mock
-    async def test_multiple_calls(self, base_url):
-        respx.post(base_url).mock(
-            side_effect=[
-                httpx.Response(200, json={"temp": 72}),
-                httpx.Response(200, json={"results": []}),
-            ]
-        )
+        assert results[0]["content"] == content
+
+    async def test_multiple_calls(
+        self, openai_adapter, tool_call_factory, mcp_route, echo_reply
+    ):
+        mcp_route.side_effect = echo_reply
 
-        adapter = MCPToolAdapterOpenAI(base_url)
         tool_calls = [
-            ChatCompletionMessageToolCall(
-                id="call_1",
-                type="function",
-                function=Function(
-                    name="get_weather",
-                    arguments=json.dumps({"location": "London"}),
-                ),
-            ),
-            ChatCompletionMessageToolCall(
-                id="call_2",
-                type="function",
-                function=Function(
-                    name="search",
-                    arguments=json.dumps({"query": "test"}),
-                ),
-            ),
+            tool_call_factory("call_1", "get_weather", {"location": "London"}),
+            tool_call_factory("call_2", "search", {"query": "test"}),
         ]
 
-        results = await adapter.process_tool_calls(tool_calls)
+        results = await openai_adapter.process_tool_calls(tool_calls)
         assert len(results) == 2
         assert results[0]["tool_call_id"] == "call_1"
         assert results[1]["tool_call_id"] == "call_2"
+        assert json.loads(results[0]["content"])["result"] == "get_weather"
+        assert json.loads(results[1]["content"])["result"] == "search"
+        # one batched tools/call request
+        assert mcp_route.call_count == 1
 
-    @respx.mock
-    async def test_invalid_json_arguments(self, base_url):
-        adapter = MCPToolAdapterOpenAI(base_url)
-        tool_calls = [
-            ChatCompletionMessageToolCall(
-                id="call_1",
-                type="function",
-                function=Function(
-                    name="get_weather",
-                    arguments="not valid json{{{",
-                ),
-            )
-        ]
+    async def test_batch_fallback_keeps_call_order(
+        self, openai_adapter, tool_call_factory, mcp_route, batch_rejecting_reply
+    ):
+        mcp_route.side_effect = batch_rejecting_reply
 
-        results = await adapter.process_tool_calls(tool_calls)
-        assert len(results) == 1
-        content = json.loads(results[0]["content"])
-        assert "error" in content
-        assert "parse" in content["error"].lower()
+        tool_calls = [tool_call_factory(f"call_{n}", f"tool_{n}", {}) for n in range(4)]
 
-    @respx.mock
-    async def test_http_error(self, base_url):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(500, text="Server Error")
-        )
+        results = await openai_adapter.process_tool_calls(tool_calls)
 
-        adapter = MCPToolAdapterOpenAI(base_url)
-        tool_calls = [
-            ChatCompletionMessageToolCall(
-                id="call_1",
-                type="function",
-                function=Function(
-                    name="get_weather",
-                    arguments=json.dumps({"location": "London"}),
-                ),
-            )
+        assert [r["tool_call_id"] for r in results] == [f"call_{n}" for n in range(4)]
+        assert [json.loads(r["content"])["result"] for r in results] == [
+            f"tool_{n}" for n in range(4)
         ]
+        # rejected batch, then one request per call
+        assert mcp_route.call_count == 5
 
-        results = await adapter.process_tool_calls(tool_calls)
-        assert len(results) == 1
-        content = json.loads(results[0]["content"])
-        assert "error" in content
-
-    @respx.mock
-    async def test_return_errors_false_omits_failures(self, base_url):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(500, text="Server Error")
-        )
+    async def test_failed_initialize_returns_error_per_call(
+        self, base_url, shared_async_client, tool_call_factory, mcp_route
+    ):
+        mcp_route.return_value = httpx.Response(500, text="Server Error")
 
-        adapter = MCPToolAdapterOpenAI(base_url)
+        adapter = MCPToolAdapterOpenAI(base_url, client=shared_async_client)
         tool_calls = [
-            ChatCompletionMessageToolCall(
-                id="call_1",
-                type="function",
-                function=Function(
-                    name="get_weather",
-                    arguments=json.dumps({"location": "London"}),
-                ),
-            )
+            tool_call_factory("call_1", "get_weather", {"location": "London"}),
+            tool_call_factory("call_2", "search", {"query": "test"}),
         ]
 
-        results = await adapter.process_tool_calls(tool_calls, return_errors=False)
-        assert len(results) == 0
+        results = await adapter.process_tool_calls(tool_calls)
 
-    @respx.mock
-    async def test_string_result_not_double_encoded(self, base_url):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json="plain string result")
-        )
+        assert [r["tool_call_id"] for r in results] == ["call_1", "call_2"]
+        for result in results:
+            assert "error" in json.loads(result["content"])
 
-        adapter = MCPToolAdapterOpenAI(base_url)
-        tool_calls = [
-            ChatCompletionMessageToolCall(
-                id="call_1",
-                type="function",
-                function=Function(
-                    name="get_weather",
-                    arguments=json.dumps({"location": "London"}),
-                ),
-            )
-        ]
+    async def test_invalid_json_arguments(self, openai_adapter, tool_call_factory):
+        tool_calls = [tool_call_factory("call_1", "get_weather", "not valid json{{{")]
 
-        results = await adapter.process_tool_calls(tool_calls)
+        results = await openai_adapter.process_tool_calls(tool_calls)
         assert len(results) == 1
-        # String results are passed through directly, not JSON-encoded again
-        assert results[0]["content"] == "plain string result"
+        content = json.loads(results[0]["content"])
+        assert "error" in content
+        assert "parse" in content["error"].lower()
 
-    @respx.mock
-    async def test_dict_result_is_json_encoded(self, base_url, sample_tool_result):
-        respx.post(base_url).mock(
-            return_value=httpx.Response(200, json=sample_tool_result)
-        )
+    @pytest.mark.parametrize(("return_errors", "count"), [(True, 1), (False, 0)])
+    async def test_http_error(
+        self, openai_adapter, tool_call_factory, mcp_route, return_errors, count
+    ):
+        mcp_route.return_value = httpx.Response(500, text="Server Error")
 
-        adapter = MCPToolAdapterOpenAI(base_url)
         tool_calls = [
-            ChatCompletionMessageToolCall(
-                id="call_1",
-                type="function",
-                function=Function(
-                    name="get_weather",
-                    arguments=json.dumps({"location": "London"}),
-                ),
-            )
+            tool_call_factory("call_1", "get_weather", {"location": "London"})
         ]
 
-        results = await adapter.process_tool_calls(tool_calls)
-        assert json.loads(results[0]["content"]) == sample_tool_result
+        results = await openai_adapter.process_tool_calls(
+            tool_calls, return_errors=return_errors
+        )
+        # failures are reported as error messages, or omitted entirely
+        assert len(results) == count
+        for result in results:
+            assert "error" in json.loads(result["content"])
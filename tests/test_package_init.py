@@ -1,20 +1,51 @@
+import subprocess
+import sys
+
 import pytest
 
+from mcphero.exceptions import INSTALL_GOOGLE_GENAI
+
+
+@pytest.fixture(scope="module")
+def mcphero_mod():
+    import mcphero
+
+    return mcphero
+
 
 class TestPackageInit:
-    def test_openai_adapter_importable(self):
-        from mcphero import MCPToolAdapterOpenAI
+    def test_openai_adapter_importable(self, mcphero_mod):
+        assert mcphero_mod.MCPToolAdapterOpenAI is not None
 
-        assert MCPToolAdapterOpenAI is not None
+    def test_all_contains_both_adapters(self, mcphero_mod):
+        assert "MCPToolAdapterOpenAI" in mcphero_mod.__all__
+        assert "MCPToolAdapterGemini" in mcphero_mod.__all__
 
-    def test_all_contains_both_adapters(self):
-        import mcphero
+    def test_invalid_attribute_raises(self, mcphero_mod):
+        with pytest.raises(AttributeError) as exc_info:
+            _ = mcphero_mod.NoSuchAdapter
+        assert (
+            str(exc_info.value) == "module 'mcphero' has no attribute 'NoSuchAdapter'"
+        )
 
-        assert "MCPToolAdapterOpenAI" in mcphero.__all__
-        assert "MCPToolAdapterGemini" in mcphero.__all__
+    def test_openai_adapter_does_not_import_openai_sdk(self):
+        code = (
+            "import sys\n"
+            "from mcphero import MCPToolAdapterOpenAI\n"
+            "assert 'openai' not in sys.modules, 'openai imported eagerly'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
 
-    def test_invalid_attribute_raises(self):
-        import mcphero
+    def test_gemini_adapter_requires_google_genai_on_use(self, monkeypatch):
+        from mcphero.adapters import gemini
 
-        with pytest.raises(AttributeError, match="has no attribute"):
-            _ = mcphero.NoSuchAdapter
+        monkeypatch.setitem(sys.modules, "google.genai", None)
+        gemini._load_genai_types.cache_clear()
+        try:
+            with pytest.raises(ImportError) as exc_info:
+                gemini.MCPToolAdapterGemini.create_function_response_content(
+                    name="ping", response={}
+                )
+            assert str(exc_info.value) == INSTALL_GOOGLE_GENAI
+        finally:
+            gemini._load_genai_types.cache_clear()